@@ -152,6 +152,30 @@ def generate_presentation(
     }
 
 
+# Files pdflatex writes on one pass and reads back on the next (labels,
+# outline, beamer navigation); if none changed, another pass is a no-op
+_LATEX_AUX_SUFFIXES = (".aux", ".toc", ".nav", ".snm", ".out")
+
+
+def _read_aux_files(output_dir: Path, stem: str) -> Dict[str, bytes]:
+    """Snapshot the auxiliary files of a LaTeX job.
+
+    Args:
+        output_dir: Directory pdflatex writes to
+        stem: Job name (the .tex file stem)
+
+    Returns:
+        Dict[str, bytes]: Contents keyed by suffix, for the files that exist
+    """
+    snapshot = {}
+    for suffix in _LATEX_AUX_SUFFIXES:
+        try:
+            snapshot[suffix] = (output_dir / f"{stem}{suffix}").read_bytes()
+        except FileNotFoundError:
+            continue
+    return snapshot
+
+
 def compile_latex(tex_path: Path, output_dir: Path) -> Path:
     """Compile LaTeX file to PDF.
 
@@ -166,8 +190,10 @@ def compile_latex(tex_path: Path, output_dir: Path) -> Path:
         CompilationError: If compilation fails
     """
     try:
-        # Run pdflatex twice for references
+        # Run pdflatex up to twice for references, stopping early when the
+        # first pass left the auxiliary files as it found them
         for _ in range(2):
+            aux_before = _read_aux_files(output_dir, tex_path.stem)
             result = subprocess.run(
                 [
                     "pdflatex",
@@ -195,6 +221,9 @@ def compile_latex(tex_path: Path, output_dir: Path) -> Path:
 
                 raise CompilationError(f"{error_msg}\n\nSee {log_path} for details")
 
+            if _read_aux_files(output_dir, tex_path.stem) == aux_before:
+                break
+
         # Return path to PDF
         pdf_path = output_dir / f"{tex_path.stem}.pdf"
         if not pdf_path.exists():
@@ -6,8 +6,9 @@ including Paper, ExtractedElement, Presentation, and related entities.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 
 
@@ -49,7 +50,7 @@ class CompilationStatus(Enum):
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Position and size of an element on a page."""
 
@@ -85,7 +86,7 @@ class PaperSection:
             raise ValueError("page_start must be <= page_end")
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedElement:
     """Base class for elements extracted from papers."""
 
@@ -106,7 +107,7 @@ class ExtractedElement:
             raise ValueError("page_number must be > 0")
 
 
-@dataclass
+@dataclass(slots=True)
 class FigureElement(ExtractedElement):
     """Figure extracted from a paper."""
 
@@ -114,12 +115,8 @@ class FigureElement(ExtractedElement):
     width_px: int = 0
     height_px: int = 0
 
-    def __post_init__(self):
-        """Validate figure and parent attributes."""
-        super().__post_init__()
-
 
-@dataclass
+@dataclass(slots=True)
 class TableElement(ExtractedElement):
     """Table extracted from a paper."""
 
@@ -127,22 +124,14 @@ class TableElement(ExtractedElement):
     columns: int = 0
     data: Optional[List[List[str]]] = None
 
-    def __post_init__(self):
-        """Validate table and parent attributes."""
-        super().__post_init__()
-
 
-@dataclass
+@dataclass(slots=True)
 class EquationElement(ExtractedElement):
     """Equation extracted from a paper."""
 
     latex_code: str = ""
     is_numbered: bool = False
 
-    def __post_init__(self):
-        """Validate equation and parent attributes."""
-        super().__post_init__()
-
 
 @dataclass
 class Paper:
@@ -198,6 +187,29 @@ class Paper:
 # ============================================================================
 
 
+def _equation_latex(element: ExtractedElement) -> str:
+    """Placeholder LaTeX for equation elements."""
+    # TODO: Implement equation generation (future phase)
+    return f"% Equation {element.sequence_number} (not yet implemented)\n"
+
+
+@cache
+def _element_latex_renderers() -> Dict[ElementType, Callable[[ExtractedElement], str]]:
+    """Map each element type to the function rendering it as LaTeX.
+
+    Built on first use because the generators live in a module that imports
+    this one.
+    """
+    # Import here to avoid circular dependency
+    from ..generation.latex_generator import LaTeXGenerator
+
+    return {
+        ElementType.FIGURE: LaTeXGenerator.generate_figure_latex,
+        ElementType.TABLE: LaTeXGenerator.generate_table_latex,
+        ElementType.EQUATION: _equation_latex,
+    }
+
+
 @dataclass
 class Slide:
     """Represents a single slide/frame in a beamer presentation."""
@@ -224,41 +236,33 @@ class Slide:
         if self.latex_code:
             return self.latex_code
 
-        # Basic frame structure
-        latex = f"\\begin{{frame}}{{{self.title}}}\n"
+        frame_start = f"\\begin{{frame}}{{{self.title}}}\n"
+        frame_end = "\\end{frame}\n"
+
+        if self.content_type in (
+            SlideContentType.FIGURE,
+            SlideContentType.TABLE,
+            SlideContentType.EQUATION,
+        ):
+            # Handle extracted elements, either a single one or a list
+            elements = self.content if isinstance(self.content, list) else [self.content]
+            return "".join(
+                [frame_start, *map(self._generate_element_latex, elements), frame_end]
+            )
+
+        # Collect fragments and join once, rather than growing a string
+        parts = [frame_start]
 
         # Content based on type
         if self.content_type == SlideContentType.TEXT:
-            latex += f"{self.content}\n"
+            parts.append(f"{self.content}\n")
         elif self.content_type == SlideContentType.ITEMIZE:
-            latex += "\\begin{itemize}\n"
-            for item in self.content:
-                latex += f"  \\item {item}\n"
-            latex += "\\end{itemize}\n"
-        elif self.content_type == SlideContentType.FIGURE:
-            # Handle figure elements
-            if isinstance(self.content, list):
-                for element in self.content:
-                    latex += self._generate_element_latex(element)
-            else:
-                latex += self._generate_element_latex(self.content)
-        elif self.content_type == SlideContentType.TABLE:
-            # Handle table elements
-            if isinstance(self.content, list):
-                for element in self.content:
-                    latex += self._generate_element_latex(element)
-            else:
-                latex += self._generate_element_latex(self.content)
-        elif self.content_type == SlideContentType.EQUATION:
-            # Handle equation elements
-            if isinstance(self.content, list):
-                for element in self.content:
-                    latex += self._generate_element_latex(element)
-            else:
-                latex += self._generate_element_latex(self.content)
-
-        latex += "\\end{frame}\n"
-        return latex
+            parts.append("\\begin{itemize}\n")
+            parts.extend(f"  \\item {item}\n" for item in self.content)
+            parts.append("\\end{itemize}\n")
+
+        parts.append(frame_end)
+        return "".join(parts)
 
     def _generate_element_latex(self, element: 'ExtractedElement') -> str:
         """Generate LaTeX code for an extracted element.
@@ -269,18 +273,10 @@ class Slide:
         Returns:
             str: LaTeX code for the element
         """
-        # Import here to avoid circular dependency
-        from ..generation.latex_generator import LaTeXGenerator
-
-        if element.element_type == ElementType.FIGURE:
-            return LaTeXGenerator.generate_figure_latex(element)
-        elif element.element_type == ElementType.TABLE:
-            return LaTeXGenerator.generate_table_latex(element)
-        elif element.element_type == ElementType.EQUATION:
-            # TODO: Implement equation generation (future phase)
-            return f"% Equation {element.sequence_number} (not yet implemented)\n"
-        else:
+        renderer = _element_latex_renderers().get(element.element_type)
+        if renderer is None:
             return f"% Unknown element type: {element.element_type}\n"
+        return renderer(element)
 
     def add_element(self, element_uuid: UUID) -> None:
         """Add extracted element reference to slide.
@@ -331,13 +327,13 @@ class Presentation:
         if self.latex_code:
             return self.latex_code
 
-        latex = f"""\\documentclass{{beamer}}
-\\usetheme{{{self.theme}}}
-"""
+        # Collect fragments and join once; with hundreds of frames, growing
+        # one string would recopy the document so far for each of them
+        parts = [f"\\documentclass{{beamer}}\n\\usetheme{{{self.theme}}}\n"]
         if self.color_theme:
-            latex += f"\\usecolortheme{{{self.color_theme}}}\n"
+            parts.append(f"\\usecolortheme{{{self.color_theme}}}\n")
 
-        latex += f"""
+        parts.append(f"""
 \\title{{{self.title}}}
 \\author{{{self.author}}}
 \\date{{{self.date}}}
@@ -346,13 +342,15 @@ class Presentation:
 
 \\frame{{\\titlepage}}
 
-"""
+""")
         # Add slides
         for slide in self.slides:
-            latex += slide.to_latex() + "\n"
+            parts.append(slide.to_latex())
+            parts.append("\n")
 
-        latex += "\\end{document}\n"
+        parts.append("\\end{document}\n")
 
+        latex = "".join(parts)
         self.latex_code = latex
         return latex
 
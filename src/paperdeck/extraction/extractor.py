@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import List, Optional
 from uuid import uuid4
 import logging
+import stat
 
 from ..core.models import (
     BoundingBox,
@@ -74,11 +75,13 @@ class PaperExtractor:
             ValueError: If paper_path is not a valid PDF
             ExtractionError: If extraction fails
         """
-        # Validate input
-        if not paper_path.exists():
-            raise FileNotFoundError(f"Paper file not found: {paper_path}")
+        # Validate input with a single stat
+        try:
+            paper_stat = paper_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"Paper file not found: {paper_path}") from None
 
-        if not paper_path.is_file():
+        if not stat.S_ISREG(paper_stat.st_mode):
             raise ValueError(f"Paper path is not a file: {paper_path}")
 
         if paper_path.suffix.lower() != ".pdf":
@@ -4,9 +4,23 @@ This module provides utility functions for PDF validation, encryption detection,
 and page counting.
 """
 
+import os
+import stat
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# The header carries the version; the trailer (and with it any /Encrypt
+# reference) always sits at the end of the file. Linearized files repeat
+# the first-page trailer near the start, hence the head scan as well.
+_HEAD_SCAN_BYTES = 1024
+_TAIL_SCAN_BYTES = 4096
+_ENCRYPT_MARKER = b"/Encrypt"
+
 
 def validate_pdf(pdf_path: Path) -> bool:
     """Validate that a file is a valid PDF.
@@ -17,23 +31,20 @@ def validate_pdf(pdf_path: Path) -> bool:
     Returns:
         bool: True if valid PDF, False otherwise
     """
-    if not pdf_path.exists():
-        return False
-
-    if not pdf_path.is_file():
-        return False
-
-    if pdf_path.suffix.lower() != ".pdf":
+    # Work on the plain string and a single stat: Path.exists(), is_file()
+    # and suffix each re-derive state from the Path object
+    path = os.fspath(pdf_path)
+    if os.path.splitext(path)[1].lower() != ".pdf":
         return False
 
     # Check PDF header
     try:
-        with open(pdf_path, "rb") as f:
+        if not stat.S_ISREG(os.stat(path).st_mode):
+            return False
+        with open(path, "rb") as f:
             header = f.read(5)
             # PDF files start with %PDF-
-            if not header.startswith(b"%PDF-"):
-                return False
-        return True
+            return header.startswith(b"%PDF-")
     except (IOError, OSError):
         return False
 
@@ -49,14 +60,19 @@ def is_encrypted(pdf_path: Path) -> bool:
 
     Note:
         This is a simple check. For production, consider using PyPDF2 or similar.
+        Only the first 1KB and last 4KB are read, whatever the file size.
     """
     try:
         with open(pdf_path, "rb") as f:
-            content = f.read(4096)  # Read first 4KB
-            # Simple check for /Encrypt keyword
-            if b"/Encrypt" in content:
+            head = f.read(_HEAD_SCAN_BYTES)
+            if _ENCRYPT_MARKER in head:
                 return True
-        return False
+            size = f.seek(0, os.SEEK_END)
+            # Overlap the head by one byte short of the marker, so a marker
+            # straddling the end of the head window is still seen whole
+            overlap = len(_ENCRYPT_MARKER) - 1
+            f.seek(max(len(head) - overlap, size - _TAIL_SCAN_BYTES, 0))
+            return _ENCRYPT_MARKER in f.read()
     except (IOError, OSError):
         return False
 
@@ -71,13 +87,22 @@ def get_page_count(pdf_path: Path) -> int:
         int: Number of pages (0 if cannot be determined)
 
     Note:
-        This is a placeholder implementation. For production, use PyPDF2 or similar.
+        With PyMuPDF installed, the count comes from the xref and page tree
+        root, without loading page content. Otherwise falls back to a rough
+        scan of the whole file.
     """
     if not validate_pdf(pdf_path):
         return 0
 
+    if fitz is not None:
+        try:
+            with fitz.open(pdf_path) as doc:
+                return int(doc.page_count)
+        except (RuntimeError, ValueError):
+            return 0
+
     try:
-        # Placeholder: Try to count /Page objects in PDF
+        # Fallback: count /Page objects in the raw bytes
         with open(pdf_path, "rb") as f:
             content = f.read()
             # Very simple heuristic: count /Type /Page occurrences
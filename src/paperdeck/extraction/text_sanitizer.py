@@ -6,7 +6,7 @@ from extracted PDF text.
 """
 
 import re
-from typing import List
+from typing import Iterable, Iterator
 from ..core.config import TextExtractionConfig
 
 
@@ -23,13 +23,24 @@ class TextSanitizer:
     - Very short lines (noise)
     """
 
+    # Header/footer artifacts (DOI, arXiv, "Page X of Y") fused into one
+    # alternation so each line passes through the regex engine only once
+    _header_footer_pattern = re.compile(
+        r"^(?:DOI:\s*[\d.\/\w-]+|arXiv:\s*[\d.]+v?\d*|Page\s+\d+\s+of\s+\d+)\s*$",
+        re.IGNORECASE,
+    )
+    # Every header/footer match starts with one of these characters, so other
+    # lines can skip the regex engine entirely
+    _header_footer_initials = frozenset("DdAaPp")
+
+    # Whitespace normalization: tabs are turned into spaces with a C-level
+    # translate, so the regex only has to touch actual runs of spaces
+    _tab_to_space = str.maketrans("\t", " ")
+    _space_run_pattern = re.compile(r" {2,}")
+    _excess_newlines_pattern = re.compile(r"\n{3,}")
+
     def __init__(self):
         """Initialize the text sanitizer."""
-        # Patterns for artifact detection
-        self._doi_pattern = re.compile(r"^DOI:\s*[\d.\/\w-]+\s*$", re.IGNORECASE | re.MULTILINE)
-        self._arxiv_pattern = re.compile(r"^arXiv:\s*[\d.]+v?\d*\s*$", re.IGNORECASE | re.MULTILINE)
-        self._page_x_of_y_pattern = re.compile(r"^Page\s+\d+\s+of\s+\d+\s*$", re.IGNORECASE | re.MULTILINE)
-        self._standalone_number_pattern = re.compile(r"^\d+$")
 
     def sanitize(self, text: str, config: TextExtractionConfig) -> str:
         """
@@ -46,21 +57,11 @@ class TextSanitizer:
             return ""
 
         # Split into lines for processing
-        lines = text.split("\n")
+        lines: Iterable[str] = text.split("\n")
 
-        # Apply sanitization filters
-        if config.remove_headers_footers:
-            lines = self._remove_doi_lines(lines)
-            lines = self._remove_arxiv_lines(lines)
-            lines = self._remove_page_x_of_y(lines)
-
-        if config.remove_page_numbers:
-            lines = self._remove_standalone_page_numbers(lines)
-            # Remove short lines (noise) only after page numbers are removed
-            lines = self._remove_short_lines(lines, config.min_line_length)
-        else:
-            # When page numbers are preserved, don't remove short lines that are just numbers
-            lines = self._remove_short_lines_preserve_numbers(lines, config.min_line_length)
+        # Drop artifact lines; the filters are chained generators so no
+        # intermediate list is built between stages
+        lines = self._filter_lines(lines, config)
 
         # Remove repeated headers
         if config.remove_headers_footers:
@@ -74,95 +75,63 @@ class TextSanitizer:
 
         return result
 
-    def _remove_doi_lines(self, lines: List[str]) -> List[str]:
-        """Remove lines containing DOI identifiers."""
-        return [
-            line for line in lines
-            if not self._doi_pattern.match(line.strip())
-        ]
-
-    def _remove_arxiv_lines(self, lines: List[str]) -> List[str]:
-        """Remove lines containing arXiv identifiers."""
-        return [
-            line for line in lines
-            if not self._arxiv_pattern.match(line.strip())
-        ]
-
-    def _remove_page_x_of_y(self, lines: List[str]) -> List[str]:
-        """Remove 'Page X of Y' pagination lines."""
-        return [
-            line for line in lines
-            if not self._page_x_of_y_pattern.match(line.strip())
-        ]
-
-    def _remove_standalone_page_numbers(self, lines: List[str]) -> List[str]:
+    def _filter_lines(
+        self, lines: Iterable[str], config: TextExtractionConfig
+    ) -> Iterator[str]:
         """
-        Remove standalone page numbers (lines with only a digit).
-
-        Preserves lines where numbers are part of content.
-        """
-        result = []
-        for line in lines:
-            stripped = line.strip()
-            # Only remove if it's JUST a number
-            if not self._standalone_number_pattern.match(stripped):
-                result.append(line)
-        return result
-
-    def _remove_short_lines(self, lines: List[str], min_length: int) -> List[str]:
-        """Remove lines shorter than min_length (after stripping)."""
-        return [
-            line for line in lines
-            if len(line.strip()) >= min_length or len(line.strip()) == 0
-        ]
+        Remove artifact lines in a single pass over the text.
 
-    def _remove_short_lines_preserve_numbers(self, lines: List[str], min_length: int) -> List[str]:
+        Header/footer patterns are only applied when remove_headers_footers
+        is set. Standalone numbers are dropped as page numbers when
+        remove_page_numbers is set and kept otherwise; any other line
+        shorter than min_line_length is treated as noise.
         """
-        Remove lines shorter than min_length, but preserve standalone numbers.
+        remove_headers_footers = config.remove_headers_footers
+        remove_page_numbers = config.remove_page_numbers
+        min_length = config.min_line_length
+        # Bind per-line lookups to locals; this loop runs once per line of the
+        # paper, so attribute lookups on self dominate its overhead
+        header_footer_initials = self._header_footer_initials
+        match_header_footer = self._header_footer_pattern.match
 
-        Used when remove_page_numbers=False to keep page numbers.
-        """
-        result = []
         for line in lines:
             stripped = line.strip()
-            # Keep empty lines, numbers, or lines meeting min_length
-            if len(stripped) == 0 or self._standalone_number_pattern.match(stripped) or len(stripped) >= min_length:
-                result.append(line)
-        return result
-
-    def _remove_repeated_lines(self, lines: List[str]) -> List[str]:
+            if not stripped:
+                # Keep empty lines for paragraph structure
+                yield line
+            elif (
+                remove_headers_footers
+                and stripped[0] in header_footer_initials
+                and match_header_footer(stripped)
+            ):
+                continue
+            elif stripped.isdecimal():
+                # Standalone number; isdecimal() matches exactly what \d+ would
+                if not remove_page_numbers:
+                    yield line
+            elif len(stripped) >= min_length:
+                yield line
+
+    def _remove_repeated_lines(self, lines: Iterable[str]) -> Iterator[str]:
         """
         Remove repeated lines that appear multiple times (headers/footers).
 
         Keeps first occurrence of any repeated line.
         """
-        # Count occurrences
-        line_counts = {}
-        for line in lines:
-            stripped = line.strip()
-            if stripped:  # Ignore empty lines
-                line_counts[stripped] = line_counts.get(stripped, 0) + 1
-
-        # Find lines that repeat 2+ times (likely headers/footers)
-        repeated_lines = {line for line, count in line_counts.items() if count >= 2}
-
-        # Keep only first occurrence of repeated lines
-        seen = set()
-        result = []
+        # Keeping the first occurrence of every repeated line is the same as
+        # keeping the first occurrence of every line, so no counting pass is
+        # needed: a single set lookup per line is enough.
+        seen: set[str] = set()
+        mark_seen = seen.add
         for line in lines:
             stripped = line.strip()
             if not stripped:
                 # Keep empty lines for paragraph structure
-                result.append(line)
-            elif stripped in repeated_lines:
-                if stripped not in seen:
-                    result.append(line)
-                    seen.add(stripped)
-                # Skip subsequent occurrences
-            else:
-                result.append(line)
-
-        return result
+                yield line
+            elif stripped not in seen:
+                mark_seen(stripped)
+                yield line
+            # Skip subsequent occurrences
 
     def _normalize_whitespace(self, text: str) -> str:
         """
@@ -172,16 +141,14 @@ class TextSanitizer:
         - 3+ newlines become 2 newlines (paragraph break)
         - Trailing/leading whitespace removed
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r"[ \t]+", " ", text)
+        # Replace runs of spaces/tabs with a single space
+        text = self._space_run_pattern.sub(" ", text.translate(self._tab_to_space))
 
         # Replace 3+ newlines with 2 newlines (paragraph break)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = self._excess_newlines_pattern.sub("\n\n", text)
 
         # Remove spaces at start/end of lines
-        lines = text.split("\n")
-        lines = [line.strip() for line in lines]
-        text = "\n".join(lines)
+        text = "\n".join(line.strip() for line in text.split("\n"))
 
         # Remove leading/trailing whitespace from entire text
         return text.strip()
@@ -4,6 +4,8 @@ This module provides LaTeX generation functionality including special character
 escaping and template rendering with custom Jinja2 delimiters.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -27,6 +29,48 @@ LATEX_SPECIAL_CHARS = {
     "\\": r"\textbackslash{}",
 }
 
+# Everything but the backslash, in replacement order: braces come before the
+# characters whose escapes introduce braces (~ and ^)
+_NON_BACKSLASH_ESCAPES = tuple(
+    (char, escaped) for char, escaped in LATEX_SPECIAL_CHARS.items() if char != "\\"
+)
+
+# Strings longer than this bypass the escape_latex memo
+_ESCAPE_CACHE_MAX_LENGTH = 256
+
+# Scaffolding for figure/table elements, specialized at import time for the
+# with- and without-caption shapes and keyed by whether a caption is present
+_FIGURE_TEMPLATES = {
+    False: (
+        "\\begin{{figure}}\n"
+        "  \\centering\n"
+        "  \\includegraphics[width={width}]{{{path}}}\n"
+        "\\end{{figure}}\n"
+    ),
+    True: (
+        "\\begin{{figure}}\n"
+        "  \\centering\n"
+        "  \\includegraphics[width={width}]{{{path}}}\n"
+        "  \\caption{{{caption}}}\n"
+        "\\end{{figure}}\n"
+    ),
+}
+_TABLE_TEMPLATES = {
+    False: (
+        "\\begin{{table}}\n"
+        "  \\centering\n"
+        "  \\includegraphics[width={width}]{{{path}}}\n"
+        "\\end{{table}}\n"
+    ),
+    True: (
+        "\\begin{{table}}\n"
+        "  \\centering\n"
+        "  \\includegraphics[width={width}]{{{path}}}\n"
+        "  \\caption{{{caption}}}\n"
+        "\\end{{table}}\n"
+    ),
+}
+
 
 def escape_latex(text: str) -> str:
     """Escape special LaTeX characters in text.
@@ -44,20 +88,32 @@ def escape_latex(text: str) -> str:
     if not text:
         return text
 
-    result = text
-    # Use placeholder to avoid double-escaping backslash command
-    BACKSLASH_PLACEHOLDER = "<<<BACKSLASH>>>"
-    result = result.replace("\\", BACKSLASH_PLACEHOLDER)
-
-    # Escape other special characters (excluding backslash)
-    for char, escaped in LATEX_SPECIAL_CHARS.items():
-        if char != "\\":  # Will handle separately
-            result = result.replace(char, escaped)
+    # Titles, author names and caption prefixes repeat across a deck, so
+    # short strings are memoized; long bodies would only churn the cache
+    if len(text) > _ESCAPE_CACHE_MAX_LENGTH:
+        return _escape_latex.__wrapped__(text)
+    return _escape_latex(text)
+
+
+@lru_cache(maxsize=4096)
+def _escape_latex(text: str) -> str:
+    """Escape special LaTeX characters in text (memoized; see escape_latex)."""
+    # Escape each backslash-free run separately and join with the backslash
+    # command, so its braces are never escaped again
+    if "\\" in text:
+        return LATEX_SPECIAL_CHARS["\\"].join(
+            _escape_non_backslash(part) for part in text.split("\\")
+        )
+    return _escape_non_backslash(text)
 
-    # Replace placeholder with escaped backslash command
-    result = result.replace(BACKSLASH_PLACEHOLDER, "\\textbackslash{}")
 
-    return result
+def _escape_non_backslash(text: str) -> str:
+    """Escape every LaTeX special character except the backslash."""
+    for char, escaped in _NON_BACKSLASH_ESCAPES:
+        # Membership scans are cheap; replace() always builds a new string
+        if char in text:
+            text = text.replace(char, escaped)
+    return text
 
 
 def get_jinja_env(template_dir: Optional[Path] = None) -> Environment:
@@ -67,6 +123,9 @@ def get_jinja_env(template_dir: Optional[Path] = None) -> Environment:
     - Variable: \\VAR{variable}
     - Block: \\BLOCK{for x in items} ... \\BLOCK{endfor}
 
+    Each call builds a new environment, which the caller may customize
+    freely. Template files are checked for changes on each load.
+
     Args:
         template_dir: Optional directory containing templates
 
@@ -99,6 +158,16 @@ def get_jinja_env(template_dir: Optional[Path] = None) -> Environment:
 create_jinja_env = get_jinja_env
 
 
+@lru_cache(maxsize=8)
+def _shared_jinja_env(template_dir: Optional[Path] = None) -> Environment:
+    """Environment shared by every LaTeXGenerator for one template directory.
+
+    Sharing keeps the compiled-template cache across generators. The result
+    must never be handed to callers that could add filters or globals.
+    """
+    return get_jinja_env(template_dir)
+
+
 class LaTeXGenerator:
     """Generate LaTeX code from presentation model using templates."""
 
@@ -109,7 +178,7 @@ class LaTeXGenerator:
             template_dir: Directory containing Jinja2 templates
         """
         self.template_dir = template_dir
-        self.env = get_jinja_env(template_dir)
+        self.env = _shared_jinja_env(template_dir)
 
     def generate_document(
         self,
@@ -180,6 +249,37 @@ class LaTeXGenerator:
         except Exception as e:
             raise GenerationError(f"Failed to render template: {e}")
 
+    def write_from_template(
+        self, presentation: Presentation, template_name: str, output_path: Path
+    ) -> Path:
+        """Render a template straight to a file.
+
+        Unlike generate_from_template, the document is written in chunks as
+        it renders, so the full LaTeX source is never held as one string.
+
+        Args:
+            presentation: Presentation model with slides
+            template_name: Name of template file to use
+            output_path: Path of the .tex file to write
+
+        Returns:
+            Path: The path written to
+
+        Raises:
+            GenerationError: If template not found or rendering fails
+        """
+        try:
+            template = self.env.get_template(template_name)
+        except Exception as e:
+            raise GenerationError(f"Failed to load template '{template_name}': {e}")
+
+        try:
+            context = self._build_context(presentation)
+            template.stream(context).dump(str(output_path), encoding="utf-8")
+            return output_path
+        except Exception as e:
+            raise GenerationError(f"Failed to render template: {e}")
+
     def generate_from_string(
         self, presentation: Presentation, template_str: str
     ) -> str:
@@ -247,18 +347,11 @@ class LaTeXGenerator:
             figure_element.output_filename, output_dir
         )
 
-        # Build LaTeX code
-        latex = "\\begin{figure}\n"
-        latex += "  \\centering\n"
-        latex += f"  \\includegraphics[width={width}]{{{graphics_path}}}\n"
-
-        # Add caption if available
-        if figure_element.caption:
-            escaped_caption = escape_latex(figure_element.caption)
-            latex += f"  \\caption{{{escaped_caption}}}\n"
-
-        latex += "\\end{figure}\n"
-        return latex
+        # Caption line only appears in the captioned template
+        caption = figure_element.caption
+        return _FIGURE_TEMPLATES[bool(caption)].format(
+            width=width, path=graphics_path, caption=escape_latex(caption)
+        )
 
     @staticmethod
     def generate_table_latex(
@@ -285,18 +378,11 @@ class LaTeXGenerator:
             table_element.output_filename, output_dir
         )
 
-        # Build LaTeX code
-        latex = "\\begin{table}\n"
-        latex += "  \\centering\n"
-        latex += f"  \\includegraphics[width={width}]{{{graphics_path}}}\n"
-
-        # Add caption if available
-        if table_element.caption:
-            escaped_caption = escape_latex(table_element.caption)
-            latex += f"  \\caption{{{escaped_caption}}}\n"
-
-        latex += "\\end{table}\n"
-        return latex
+        # Caption line only appears in the captioned template
+        caption = table_element.caption
+        return _TABLE_TEMPLATES[bool(caption)].format(
+            width=width, path=graphics_path, caption=escape_latex(caption)
+        )
 
     @staticmethod
     def _format_graphics_path(
@@ -306,6 +392,7 @@ class LaTeXGenerator:
         """Format graphics path for LaTeX \\includegraphics command.
 
         Converts absolute paths to relative paths from output directory.
+        Results are memoized per (figure_path, output_dir) pair.
 
         Args:
             figure_path: Absolute path to the figure file
@@ -314,18 +401,30 @@ class LaTeXGenerator:
         Returns:
             str: Formatted path suitable for \\includegraphics{}
         """
-        if output_dir and figure_path.is_absolute():
-            try:
-                # Make path relative to output directory
-                relative_path = figure_path.relative_to(output_dir)
-                # Use forward slashes for LaTeX compatibility
-                return str(relative_path).replace("\\", "/")
-            except ValueError:
-                # figure_path is not relative to output_dir, use absolute path
-                pass
-
-        # Use forward slashes for LaTeX compatibility
-        return str(figure_path).replace("\\", "/")
+        return _format_graphics_path_cached(figure_path, output_dir)
+
+
+@lru_cache(maxsize=1024)
+def _format_graphics_path_cached(figure_path: Path, output_dir: Optional[Path]) -> str:
+    """Memoized implementation of LaTeXGenerator._format_graphics_path.
+
+    Works on plain strings rather than pathlib arithmetic; Path objects are
+    already normalized, so a prefix check matches Path.relative_to.
+    """
+    graphics_path = os.fspath(figure_path)
+    if output_dir and os.path.isabs(graphics_path):
+        # Make path relative to output directory; if figure_path is not
+        # inside output_dir, keep the absolute path
+        output_path = os.fspath(output_dir)
+        if graphics_path == output_path:
+            graphics_path = "."
+        else:
+            prefix = output_path if output_path.endswith(os.sep) else output_path + os.sep
+            if graphics_path.startswith(prefix):
+                graphics_path = graphics_path[len(prefix):]
+
+    # Use forward slashes for LaTeX compatibility
+    return graphics_path.replace("\\", "/")
 
 
 # Keep old name for backwards compatibility
@@ -4,9 +4,10 @@ Data models for PDF text extraction results.
 This module defines the status and result entities for text extraction operations.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional, Sequence
 
 
 class ExtractionStatus(Enum):
@@ -18,7 +19,7 @@ class ExtractionStatus(Enum):
     NOT_ATTEMPTED = "not_attempted"  # Text extraction was not attempted
 
 
-@dataclass
+@dataclass(slots=True)
 class TextExtractionResult:
     """Result of PDF text extraction."""
 
@@ -29,7 +30,7 @@ class TextExtractionResult:
     page_count: int                   # Number of pages processed
     extraction_time_seconds: float    # Time taken for extraction
     error_message: Optional[str] = None  # Error details if failed
-    warnings: list[str] = field(default_factory=list)  # Non-fatal issues encountered
+    warnings: Sequence[str] = ()      # Non-fatal issues (shared empty tuple by default)
 
     @property
     def is_successful(self) -> bool:
@@ -45,39 +46,46 @@ class TextExtractionResult:
         return (reduction / self.raw_text_length) * 100
 
 
-def validate_extraction_result(result: TextExtractionResult) -> list[str]:
+def validate_extraction_result(
+    result: TextExtractionResult, fail_fast: bool = False
+) -> list[str]:
     """
     Validate extraction result for consistency.
 
     Args:
         result: TextExtractionResult to validate
+        fail_fast: Stop at the first error instead of collecting all of them
 
     Returns:
         List of validation error messages (empty if valid)
     """
-    errors = []
+    errors = _iter_extraction_result_errors(result)
+    if fail_fast:
+        return list(islice(errors, 1))
+    return list(errors)
 
+
+def _iter_extraction_result_errors(result: TextExtractionResult) -> Iterator[str]:
+    """Yield validation error messages for an extraction result, lazily."""
     # Status-specific validations
     if result.status == ExtractionStatus.SUCCESS:
         if not result.text_content:
-            errors.append("SUCCESS status requires non-empty text_content")
+            yield "SUCCESS status requires non-empty text_content"
         if result.error_message:
-            errors.append("SUCCESS status should not have error_message")
+            yield "SUCCESS status should not have error_message"
 
     if result.status == ExtractionStatus.FAILED:
         if not result.error_message:
-            errors.append("FAILED status requires error_message")
+            yield "FAILED status requires error_message"
         if result.text_content:
-            errors.append("FAILED status should not have text_content")
+            yield "FAILED status should not have text_content"
 
     # Range validations
     if result.extraction_time_seconds < 0:
-        errors.append("extraction_time_seconds must be non-negative")
+        yield "extraction_time_seconds must be non-negative"
 
     if result.page_count < 0:
-        errors.append("page_count must be non-negative")
+        yield "page_count must be non-negative"
 
     if result.clean_text_length > result.raw_text_length:
-        errors.append("clean_text_length cannot exceed raw_text_length")
-
-    return errors
+        yield "clean_text_length cannot exceed raw_text_length"
@@ -6,16 +6,16 @@ including paper metadata and full text content.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMRequestContext:
     """Context for LLM presentation generation request."""
 
     # Paper metadata (existing)
     paper_title: Optional[str]
-    paper_authors: list[str]
+    paper_authors: Sequence[str]        # Read-only; tuples and lists both accepted
     paper_abstract: Optional[str]
 
     # NEW: Full paper text content
@@ -0,0 +1,223 @@
+"""
+Shared fixtures for unit tests.
+
+Nothing here parses PDF bytes (extraction is always mocked), so the
+sample file is created empty, once per session.
+The extraction results are read-only and likewise built once.
+"""
+
+import copy
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from paperdeck.ai.service import AIRequest, AIResponse, AIService
+from paperdeck.core.config import AppConfiguration, TextExtractionConfig
+from paperdeck.core.models import Paper, Slide, SlideContentType
+from paperdeck.models.extraction_result import (
+    ExtractionStatus,
+    TextExtractionResult,
+)
+
+
+@pytest.fixture(scope="session")
+def sample_pdf_path(tmp_path_factory):
+    """An empty placeholder PDF file shared by the whole session."""
+    pdf_file = tmp_path_factory.mktemp("papers") / "test_paper.pdf"
+    # Paper.__post_init__ requires the file to exist, but nothing reads it
+    pdf_file.touch()
+    return pdf_file
+
+
+@pytest.fixture(scope="session")
+def sample_txt_path(sample_pdf_path):
+    """An existing non-PDF file beside the sample PDF, for extension checks."""
+    txt_file = sample_pdf_path.with_name("test_paper.txt")
+    txt_file.touch()
+    return txt_file
+
+
+@pytest.fixture(scope="module")
+def sample_paper(sample_pdf_path):
+    """A bare Paper over the sample PDF; tests must not modify it."""
+    return Paper(file_path=sample_pdf_path)
+
+
+@pytest.fixture(scope="module")
+def sample_slide():
+    """A one-line text slide; tests must not modify it."""
+    return Slide(
+        title="Title",
+        content_type=SlideContentType.TEXT,
+        content="Content",
+        sequence_number=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def app_config():
+    """App configuration with text extraction enabled."""
+    config = AppConfiguration()
+    config.text_extraction = TextExtractionConfig(enabled=True)
+    return config
+
+
+@pytest.fixture(scope="session")
+def success_extraction_result():
+    """A successful extraction result."""
+    return TextExtractionResult(
+        status=ExtractionStatus.SUCCESS,
+        text_content="Some text",
+        raw_text_length=1000,
+        clean_text_length=900,
+        page_count=10,
+        extraction_time_seconds=0.1,
+    )
+
+
+@pytest.fixture(scope="session")
+def failed_extraction_result():
+    """A failed extraction result with no text."""
+    return TextExtractionResult(
+        status=ExtractionStatus.FAILED,
+        text_content=None,
+        raw_text_length=0,
+        clean_text_length=0,
+        page_count=5,
+        extraction_time_seconds=0.1,
+        error_message="PDF is encrypted",
+    )
+
+
+@pytest.fixture(scope="session")
+def partial_extraction_result():
+    """A partial extraction result carrying a warning."""
+    return TextExtractionResult(
+        status=ExtractionStatus.PARTIAL,
+        text_content="Partially extracted text",
+        raw_text_length=1000,
+        clean_text_length=500,
+        page_count=10,
+        extraction_time_seconds=0.5,
+        warnings=("Some warnings",),
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_extraction_result():
+    """A SUCCESS result whose text is empty."""
+    return TextExtractionResult(
+        status=ExtractionStatus.SUCCESS,
+        text_content="",
+        raw_text_length=0,
+        clean_text_length=0,
+        page_count=0,
+        extraction_time_seconds=0.0,
+    )
+
+
+class MockAIService(AIService):
+    """Trivial AIService returning an empty Beamer document."""
+
+    def generate(self, request: AIRequest) -> AIResponse:
+        return AIResponse(
+            content="\\documentclass{beamer}\n\\begin{document}\n\\end{document}",
+            model=request.model,
+            tokens_used=100,
+        )
+
+    def is_available(self) -> bool:
+        return True
+
+    def validate_config(self) -> bool:
+        return True
+
+
+class StubAIService(MockAIService):
+    """AIService that replays scripted outcomes from ``generate``.
+
+    Each call takes the next item from ``outcomes``: exceptions are raised,
+    anything else is returned. ``call_count`` records how many calls were made.
+    """
+
+    def __init__(self, outcomes):
+        self._outcomes = iter(outcomes)
+        self.call_count = 0
+
+    def generate(self, request: AIRequest) -> AIResponse:
+        self.call_count += 1
+        outcome = next(self._outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def mock_ai_service():
+    """A fresh MockAIService; tests may replace its methods."""
+    return MockAIService()
+
+
+@pytest.fixture
+def stub_ai_service():
+    """Factory building a StubAIService from a sequence of outcomes."""
+    return StubAIService
+
+
+@pytest.fixture(scope="session")
+def real_openai():
+    """The genuine ``openai.OpenAI`` class, captured before any patching."""
+    import openai
+
+    return openai.OpenAI
+
+
+@pytest.fixture(scope="module")
+def patched_openai(real_openai):
+    """Replace the OpenAI client class for the rest of the module.
+
+    OpenAIAdapter imports ``OpenAI`` lazily in ``_get_client``, so the
+    class is replaced on the ``openai`` package itself. The function-scoped
+    ``monkeypatch`` fixture cannot back a module fixture, hence the
+    explicit context. Tests reset the mock before configuring it; a test
+    that needs the unpatched client restores ``real_openai``.
+    """
+    mock_openai = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("openai.OpenAI", mock_openai)
+        yield mock_openai
+
+
+@pytest.fixture(scope="session")
+def openai_response_proto():
+    """A chat-completion response tree shaped like the OpenAI client's."""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = "\\documentclass{beamer}"
+    response.model = "gpt-4"
+    response.usage.total_tokens = 1500
+    return response
+
+
+@pytest.fixture
+def openai_response(openai_response_proto):
+    """A shallow copy of the response prototype.
+
+    Top-level attributes may be reassigned freely; nested children such as
+    ``choices`` are shared with the prototype and must not be mutated.
+    """
+    return copy.copy(openai_response_proto)
+
+
+@pytest.fixture(scope="module")
+def openai_adapter_proto():
+    """An OpenAIAdapter built once per module; copy it rather than using it."""
+    from paperdeck.ai.openai_adapter import OpenAIAdapter
+
+    return OpenAIAdapter(api_key="test-key")
+
+
+@pytest.fixture
+def openai_adapter(openai_adapter_proto):
+    """A fresh shallow copy of the prototype adapter, with no cached client."""
+    return copy.copy(openai_adapter_proto)
@@ -4,7 +4,6 @@ Unit tests for TextExtractionConfig.
 Following TDD approach: These tests define expected behavior before full implementation.
 """
 
-import pytest
 from paperdeck.core.config import TextExtractionConfig
 
 
@@ -10,18 +10,28 @@ from paperdeck.extraction.text_sanitizer import TextSanitizer
 from paperdeck.core.config import TextExtractionConfig
 
 
-class TestTextSanitizerHeaderFooterRemoval:
-    """Tests for header and footer removal functionality."""
+# Non-default configurations shared by the configuration tests; sanitize()
+# only reads its config, so these are built once at import
+PAGE_NUMBERS_KEPT_CONFIG = TextExtractionConfig(remove_page_numbers=False)
+HEADERS_FOOTERS_KEPT_CONFIG = TextExtractionConfig(remove_headers_footers=False)
+MIN_LINE_LENGTH_5_CONFIG = TextExtractionConfig(min_line_length=5)
+
+
+# Neither fixture is mutated by the tests, so one instance serves the module
+@pytest.fixture(scope="module")
+def sanitizer():
+    """Create a text sanitizer instance."""
+    return TextSanitizer()
 
-    @pytest.fixture
-    def sanitizer(self):
-        """Create a text sanitizer instance."""
-        return TextSanitizer()
 
-    @pytest.fixture
-    def default_config(self):
-        """Create default extraction config."""
-        return TextExtractionConfig()
+@pytest.fixture(scope="module")
+def default_config():
+    """Create default extraction config."""
+    return TextExtractionConfig()
+
+
+class TestTextSanitizerHeaderFooterRemoval:
+    """Tests for header and footer removal functionality."""
 
     def test_sanitize_removes_page_numbers(self, sanitizer, default_config):
         """Test that sanitize() removes standalone page numbers."""
@@ -135,14 +145,6 @@ Content from page 3."""
 class TestTextSanitizerPatternMatching:
     """Tests for pattern-based text cleaning."""
 
-    @pytest.fixture
-    def sanitizer(self):
-        return TextSanitizer()
-
-    @pytest.fixture
-    def default_config(self):
-        return TextExtractionConfig()
-
     def test_sanitize_removes_very_short_lines(self, sanitizer, default_config):
         """Test that sanitize() removes very short lines based on min_line_length."""
         # This test will FAIL initially
@@ -209,23 +211,17 @@ Figure 3 illustrates the approach."""
 class TestTextSanitizerConfiguration:
     """Tests for configuration-driven sanitization behavior."""
 
-    @pytest.fixture
-    def sanitizer(self):
-        return TextSanitizer()
-
-    def test_sanitize_respects_remove_page_numbers_setting(self, sanitizer):
+    def test_sanitize_respects_remove_page_numbers_setting(self, sanitizer, default_config):
         """Test that sanitize() respects remove_page_numbers config."""
         # This test will FAIL initially
 
         text = "Introduction\n1\nResults\n2\nConclusion"
 
-        # With removal enabled
-        config_enabled = TextExtractionConfig(remove_page_numbers=True)
-        result_enabled = sanitizer.sanitize(text, config_enabled)
+        # With removal enabled (the default)
+        result_enabled = sanitizer.sanitize(text, default_config)
 
         # With removal disabled
-        config_disabled = TextExtractionConfig(remove_page_numbers=False)
-        result_disabled = sanitizer.sanitize(text, config_disabled)
+        result_disabled = sanitizer.sanitize(text, PAGE_NUMBERS_KEPT_CONFIG)
 
         # Enabled should remove page numbers
         assert "\n1\n" not in result_enabled
@@ -233,19 +229,17 @@ class TestTextSanitizerConfiguration:
         # Disabled should preserve them
         assert "1" in result_disabled
 
-    def test_sanitize_respects_min_line_length_setting(self, sanitizer):
+    def test_sanitize_respects_min_line_length_setting(self, sanitizer, default_config):
         """Test that sanitize() respects min_line_length config."""
         # This test will FAIL initially
 
         text = "Good content\na\nbb\nccc\nMore content"
 
-        # With min_line_length=3
-        config_3 = TextExtractionConfig(min_line_length=3)
-        result_3 = sanitizer.sanitize(text, config_3)
+        # With min_line_length=3 (the default)
+        result_3 = sanitizer.sanitize(text, default_config)
 
         # With min_line_length=5
-        config_5 = TextExtractionConfig(min_line_length=5)
-        result_5 = sanitizer.sanitize(text, config_5)
+        result_5 = sanitizer.sanitize(text, MIN_LINE_LENGTH_5_CONFIG)
 
         # config_3 should keep "ccc" (length 3)
         assert "ccc" in result_3
@@ -257,19 +251,17 @@ class TestTextSanitizerConfiguration:
         assert "Good content" in result_3
         assert "Good content" in result_5
 
-    def test_sanitize_respects_remove_headers_footers_setting(self, sanitizer):
+    def test_sanitize_respects_remove_headers_footers_setting(self, sanitizer, default_config):
         """Test that sanitize() respects remove_headers_footers config."""
         # This test will FAIL initially
 
         text = "Content\nDOI: 10.1234/test\nMore content"
 
-        # With removal enabled
-        config_enabled = TextExtractionConfig(remove_headers_footers=True)
-        result_enabled = sanitizer.sanitize(text, config_enabled)
+        # With removal enabled (the default)
+        result_enabled = sanitizer.sanitize(text, default_config)
 
         # With removal disabled
-        config_disabled = TextExtractionConfig(remove_headers_footers=False)
-        result_disabled = sanitizer.sanitize(text, config_disabled)
+        result_disabled = sanitizer.sanitize(text, HEADERS_FOOTERS_KEPT_CONFIG)
 
         # Enabled should remove DOI
         assert "DOI:" not in result_enabled
@@ -281,14 +273,6 @@ class TestTextSanitizerConfiguration:
 class TestTextSanitizerQuality:
     """Tests for sanitization quality and edge cases."""
 
-    @pytest.fixture
-    def sanitizer(self):
-        return TextSanitizer()
-
-    @pytest.fixture
-    def default_config(self):
-        return TextExtractionConfig()
-
     def test_sanitize_preserves_paragraph_structure(self, sanitizer, default_config):
         """Test that sanitize() preserves paragraph breaks."""
         # This test will FAIL initially
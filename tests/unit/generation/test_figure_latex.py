@@ -4,9 +4,10 @@ Unit tests for figure and table LaTeX generation.
 Tests the LaTeX code generation for figure and table elements in slides.
 """
 
+import itertools
 import pytest
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID
 
 from paperdeck.core.models import (
     BoundingBox,
@@ -20,14 +21,30 @@ from paperdeck.core.models import (
 from paperdeck.generation.latex_generator import LaTeXGenerator
 
 
+# These tests only need distinct element ids, so a counter avoids drawing
+# from os.urandom for every element the way uuid4() does
+_uuid_counter = itertools.count(1)
+
+
+def _next_uuid() -> UUID:
+    """Return a unique, deterministic UUID for a test element."""
+    return UUID(int=next(_uuid_counter))
+
+
+def _assert_all_in(latex: str, expected: list) -> None:
+    """Assert every expected fragment occurs in latex, reporting all misses."""
+    missing = [fragment for fragment in expected if fragment not in latex]
+    assert not missing, f"missing from LaTeX output: {missing}"
+
+
 class TestFigureLatexGeneration:
     """Tests for figure LaTeX generation."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_figure(self):
         """Create a sample figure element."""
         return FigureElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.FIGURE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -44,16 +61,21 @@ class TestFigureLatexGeneration:
         """Test generating LaTeX for figure with caption."""
         latex = LaTeXGenerator.generate_figure_latex(sample_figure)
 
-        assert "\\begin{figure}" in latex
-        assert "\\includegraphics" in latex
-        assert "extracted/figure_1.png" in latex
-        assert "\\caption{Sample Figure Caption}" in latex
-        assert "\\end{figure}" in latex
+        _assert_all_in(
+            latex,
+            [
+                "\\begin{figure}",
+                "\\includegraphics",
+                "extracted/figure_1.png",
+                "\\caption{Sample Figure Caption}",
+                "\\end{figure}",
+            ],
+        )
 
     def test_generate_figure_latex_without_caption(self):
         """Test generating LaTeX for figure without caption."""
         figure = FigureElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.FIGURE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -72,7 +94,7 @@ class TestFigureLatexGeneration:
     def test_generate_figure_latex_without_filename(self):
         """Test generating LaTeX for figure without output file."""
         figure = FigureElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.FIGURE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -116,11 +138,11 @@ class TestFigureLatexGeneration:
 class TestSlideWithFigures:
     """Tests for Slide.to_latex() with figure content."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def figure_slide(self):
         """Create a slide with figure content."""
         figure = FigureElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.FIGURE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -141,18 +163,23 @@ class TestSlideWithFigures:
         """Test Slide.to_latex() generates figure content."""
         latex = figure_slide.to_latex()
 
-        assert "\\begin{frame}{Figure Slide}" in latex
-        assert "\\begin{figure}" in latex
-        assert "\\includegraphics" in latex
-        assert "extracted/figure_1.png" in latex
-        assert "\\caption{Test Figure}" in latex
-        assert "\\end{frame}" in latex
+        _assert_all_in(
+            latex,
+            [
+                "\\begin{frame}{Figure Slide}",
+                "\\begin{figure}",
+                "\\includegraphics",
+                "extracted/figure_1.png",
+                "\\caption{Test Figure}",
+                "\\end{frame}",
+            ],
+        )
 
     def test_slide_to_latex_with_multiple_figures(self):
         """Test slide with multiple figures."""
         figures = [
             FigureElement(
-                uuid=uuid4(),
+                uuid=_next_uuid(),
                 element_type=ElementType.FIGURE,
                 page_number=1,
                 bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -181,11 +208,11 @@ class TestSlideWithFigures:
 class TestTableLatexGeneration:
     """Tests for table LaTeX generation."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_table(self):
         """Create a sample table element."""
         return TableElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.TABLE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
@@ -201,16 +228,21 @@ class TestTableLatexGeneration:
         """Test generating LaTeX for table with caption."""
         latex = LaTeXGenerator.generate_table_latex(sample_table)
 
-        assert "\\begin{table}" in latex
-        assert "\\includegraphics" in latex
-        assert "extracted/table_1.png" in latex
-        assert "\\caption{Sample Table Caption}" in latex
-        assert "\\end{table}" in latex
+        _assert_all_in(
+            latex,
+            [
+                "\\begin{table}",
+                "\\includegraphics",
+                "extracted/table_1.png",
+                "\\caption{Sample Table Caption}",
+                "\\end{table}",
+            ],
+        )
 
     def test_generate_table_latex_without_caption(self):
         """Test generating LaTeX for table without caption."""
         table = TableElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.TABLE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
@@ -229,7 +261,7 @@ class TestTableLatexGeneration:
     def test_generate_table_latex_without_filename(self):
         """Test generating LaTeX for table without output file."""
         table = TableElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.TABLE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
@@ -263,11 +295,11 @@ class TestTableLatexGeneration:
 class TestSlideWithTables:
     """Tests for Slide.to_latex() with table content."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def table_slide(self):
         """Create a slide with table content."""
         table = TableElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.TABLE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
@@ -290,18 +322,23 @@ class TestSlideWithTables:
         """Test Slide.to_latex() generates table content."""
         latex = table_slide.to_latex()
 
-        assert "\\begin{frame}{Table Slide}" in latex
-        assert "\\begin{table}" in latex
-        assert "\\includegraphics" in latex
-        assert "extracted/table_1.png" in latex
-        assert "\\caption{Test Table}" in latex
-        assert "\\end{frame}" in latex
+        _assert_all_in(
+            latex,
+            [
+                "\\begin{frame}{Table Slide}",
+                "\\begin{table}",
+                "\\includegraphics",
+                "extracted/table_1.png",
+                "\\caption{Test Table}",
+                "\\end{frame}",
+            ],
+        )
 
     def test_slide_to_latex_with_multiple_tables(self):
         """Test slide with multiple tables."""
         tables = [
             TableElement(
-                uuid=uuid4(),
+                uuid=_next_uuid(),
                 element_type=ElementType.TABLE,
                 page_number=1,
                 bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
@@ -333,7 +370,7 @@ class TestMixedElementSlides:
     def test_presentation_with_figures_and_tables(self):
         """Test that both figures and tables can be in same presentation."""
         figure = FigureElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.FIGURE,
             page_number=1,
             bounding_box=BoundingBox(x=10, y=20, width=300, height=200),
@@ -344,7 +381,7 @@ class TestMixedElementSlides:
         )
 
         table = TableElement(
-            uuid=uuid4(),
+            uuid=_next_uuid(),
             element_type=ElementType.TABLE,
             page_number=2,
             bounding_box=BoundingBox(x=10, y=20, width=400, height=300),
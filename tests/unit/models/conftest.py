@@ -0,0 +1,38 @@
+"""
+Shared fixtures for model unit tests.
+
+Tests derive their variants from one prototype per model with
+dataclasses.replace, rather than spelling out every field each time.
+"""
+
+import dataclasses
+
+import pytest
+
+from paperdeck.models.extraction_result import (
+    ExtractionStatus,
+    TextExtractionResult,
+)
+
+
+@pytest.fixture(scope="session")
+def baseline_extraction_result():
+    """A valid SUCCESS extraction result shared by the whole session."""
+    return TextExtractionResult(
+        status=ExtractionStatus.SUCCESS,
+        text_content="text",
+        raw_text_length=100,
+        clean_text_length=90,
+        page_count=10,
+        extraction_time_seconds=0.25,
+    )
+
+
+@pytest.fixture
+def make_result(baseline_extraction_result):
+    """Factory for results that differ from the baseline in the given fields."""
+
+    def _make_result(**changes):
+        return dataclasses.replace(baseline_extraction_result, **changes)
+
+    return _make_result
@@ -5,12 +5,18 @@ Following TDD approach: These tests define expected behavior before implementati
 """
 
 import pytest
+
 from paperdeck.models.extraction_result import (
     ExtractionStatus,
-    TextExtractionResult,
     validate_extraction_result,
 )
 
+# Bound once so the tests below read plain module globals
+SUCCESS = ExtractionStatus.SUCCESS
+PARTIAL = ExtractionStatus.PARTIAL
+FAILED = ExtractionStatus.FAILED
+NOT_ATTEMPTED = ExtractionStatus.NOT_ATTEMPTED
+
 
 class TestExtractionStatus:
     """Tests for ExtractionStatus enum."""
@@ -33,30 +39,27 @@ class TestExtractionStatus:
 class TestTextExtractionResult:
     """Tests for TextExtractionResult dataclass."""
 
-    def test_successful_extraction_result(self):
+    def test_successful_extraction_result(self, make_result):
         """Test creating a successful extraction result."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
+        result = make_result(
             text_content="Abstract: This paper presents...",
             raw_text_length=5000,
             clean_text_length=4500,
-            page_count=10,
-            extraction_time_seconds=0.25,
         )
 
-        assert result.status == ExtractionStatus.SUCCESS
+        assert result.status == SUCCESS
         assert result.text_content == "Abstract: This paper presents..."
         assert result.raw_text_length == 5000
         assert result.clean_text_length == 4500
         assert result.page_count == 10
         assert result.extraction_time_seconds == 0.25
         assert result.error_message is None
-        assert result.warnings == []
+        assert not result.warnings
 
-    def test_failed_extraction_result(self):
+    def test_failed_extraction_result(self, make_result):
         """Test creating a failed extraction result."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.FAILED,
+        result = make_result(
+            status=FAILED,
             text_content=None,
             raw_text_length=0,
             clean_text_length=0,
@@ -65,84 +68,51 @@ class TestTextExtractionResult:
             error_message="PDF is encrypted",
         )
 
-        assert result.status == ExtractionStatus.FAILED
+        assert result.status == FAILED
         assert result.text_content is None
         assert result.error_message == "PDF is encrypted"
 
-    def test_partial_extraction_with_warnings(self):
+    def test_default_warnings_are_immutable(self, make_result):
+        """Test the default warnings are an empty tuple that cannot be appended to."""
+        result = make_result()
+
+        assert result.warnings == ()
+        with pytest.raises(AttributeError):
+            result.warnings.append("late warning")
+
+    def test_partial_extraction_with_warnings(self, make_result):
         """Test extraction result with warnings."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.PARTIAL,
+        result = make_result(
+            status=PARTIAL,
             text_content="Some text extracted...",
-            raw_text_length=1000,
-            clean_text_length=800,
-            page_count=10,
-            extraction_time_seconds=0.5,
             warnings=["Unusual layout detected on pages 5-7"],
         )
 
-        assert result.status == ExtractionStatus.PARTIAL
+        assert result.status == PARTIAL
         assert len(result.warnings) == 1
         assert "Unusual layout" in result.warnings[0]
 
-    def test_is_successful_property_for_success(self):
-        """Test is_successful property returns True for SUCCESS status."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content="text",
-            raw_text_length=100,
-            clean_text_length=90,
-            page_count=5,
-            extraction_time_seconds=0.1,
-        )
-
-        assert result.is_successful is True
-
-    def test_is_successful_property_for_partial(self):
-        """Test is_successful property returns True for PARTIAL status."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.PARTIAL,
-            text_content="text",
-            raw_text_length=100,
-            clean_text_length=90,
-            page_count=5,
-            extraction_time_seconds=0.1,
-        )
-
-        assert result.is_successful is True
-
-    def test_is_successful_property_for_failed(self):
-        """Test is_successful property returns False for FAILED status."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.FAILED,
-            text_content=None,
-            raw_text_length=0,
-            clean_text_length=0,
-            page_count=5,
-            extraction_time_seconds=0.1,
-            error_message="Error",
-        )
+    @pytest.mark.parametrize(
+        "status,expected",
+        [(SUCCESS, True), (PARTIAL, True), (FAILED, False), (NOT_ATTEMPTED, False)],
+    )
+    def test_is_successful_property(self, make_result, status, expected):
+        """Test is_successful is True only for SUCCESS and PARTIAL statuses."""
+        result = make_result(status=status)
 
-        assert result.is_successful is False
+        assert result.is_successful is expected
 
-    def test_sanitization_reduction_pct_calculation(self):
+    def test_sanitization_reduction_pct_calculation(self, make_result):
         """Test sanitization reduction percentage calculation."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content="text",
-            raw_text_length=1000,
-            clean_text_length=800,
-            page_count=10,
-            extraction_time_seconds=0.25,
-        )
+        result = make_result(raw_text_length=1000, clean_text_length=800)
 
         # (1000 - 800) / 1000 * 100 = 20%
         assert result.sanitization_reduction_pct == 20.0
 
-    def test_sanitization_reduction_pct_zero_raw_length(self):
+    def test_sanitization_reduction_pct_zero_raw_length(self, make_result):
         """Test sanitization reduction with zero raw length."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.FAILED,
+        result = make_result(
+            status=FAILED,
             text_content=None,
             raw_text_length=0,
             clean_text_length=0,
@@ -157,39 +127,23 @@ class TestTextExtractionResult:
 class TestValidateExtractionResult:
     """Tests for extraction result validation."""
 
-    def test_validation_passes_for_valid_success_result(self):
+    def test_validation_passes_for_valid_success_result(self, baseline_extraction_result):
         """Test validation passes for valid SUCCESS result."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content="text",
-            raw_text_length=100,
-            clean_text_length=90,
-            page_count=10,
-            extraction_time_seconds=0.25,
-        )
-
-        errors = validate_extraction_result(result)
+        errors = validate_extraction_result(baseline_extraction_result)
         assert len(errors) == 0
 
-    def test_validation_fails_success_without_text_content(self):
+    def test_validation_fails_success_without_text_content(self, make_result):
         """Test validation fails for SUCCESS status without text_content."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content=None,
-            raw_text_length=100,
-            clean_text_length=90,
-            page_count=10,
-            extraction_time_seconds=0.25,
-        )
+        result = make_result(text_content=None)
 
-        errors = validate_extraction_result(result)
-        assert len(errors) > 0
-        assert any("text_content" in error for error in errors)
+        errors = validate_extraction_result(result, fail_fast=True)
+        assert len(errors) == 1
+        assert "text_content" in errors[0]
 
-    def test_validation_fails_failed_without_error_message(self):
+    def test_validation_fails_failed_without_error_message(self, make_result):
         """Test validation fails for FAILED status without error_message."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.FAILED,
+        result = make_result(
+            status=FAILED,
             text_content=None,
             raw_text_length=0,
             clean_text_length=0,
@@ -198,36 +152,42 @@ class TestValidateExtractionResult:
             error_message=None,
         )
 
-        errors = validate_extraction_result(result)
-        assert len(errors) > 0
-        assert any("error_message" in error for error in errors)
+        errors = validate_extraction_result(result, fail_fast=True)
+        assert len(errors) == 1
+        assert "error_message" in errors[0]
 
-    def test_validation_fails_negative_extraction_time(self):
+    def test_validation_fails_negative_extraction_time(self, make_result):
         """Test validation fails for negative extraction_time_seconds."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content="text",
-            raw_text_length=100,
-            clean_text_length=90,
-            page_count=10,
-            extraction_time_seconds=-0.5,
-        )
+        result = make_result(extraction_time_seconds=-0.5)
 
-        errors = validate_extraction_result(result)
-        assert len(errors) > 0
-        assert any("extraction_time_seconds" in error for error in errors)
+        errors = validate_extraction_result(result, fail_fast=True)
+        assert len(errors) == 1
+        assert "extraction_time_seconds" in errors[0]
 
-    def test_validation_fails_clean_exceeds_raw_length(self):
+    def test_validation_fails_clean_exceeds_raw_length(self, make_result):
         """Test validation fails when clean_text_length > raw_text_length."""
-        result = TextExtractionResult(
-            status=ExtractionStatus.SUCCESS,
-            text_content="text",
-            raw_text_length=100,
-            clean_text_length=200,  # Invalid: exceeds raw
-            page_count=10,
-            extraction_time_seconds=0.25,
-        )
+        result = make_result(clean_text_length=200)  # Invalid: exceeds raw of 100
 
         errors = validate_extraction_result(result)
         assert len(errors) > 0
-        assert any("clean_text_length" in error and "exceed" in error for error in errors)
+        assert "clean_text_length cannot exceed" in "\n".join(errors)
+
+    def test_validation_collects_all_errors_by_default(self, make_result):
+        """Test validation reports every problem unless fail_fast is set."""
+        result = make_result(text_content=None, extraction_time_seconds=-0.5, page_count=-1)
+
+        errors = validate_extraction_result(result)
+        assert len(errors) == 3
+
+    def test_validation_fail_fast_stops_at_first_error(self, make_result):
+        """Test fail_fast returns only the first error found."""
+        result = make_result(text_content=None, extraction_time_seconds=-0.5, page_count=-1)
+
+        errors = validate_extraction_result(result, fail_fast=True)
+        assert errors == ["SUCCESS status requires non-empty text_content"]
+
+    def test_validation_fail_fast_returns_empty_for_valid_result(
+        self, baseline_extraction_result
+    ):
+        """Test fail_fast still returns an empty list for a valid result."""
+        assert validate_extraction_result(baseline_extraction_result, fail_fast=True) == []
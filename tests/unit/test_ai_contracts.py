@@ -6,110 +6,147 @@ from unittest.mock import Mock
 from paperdeck.ai.service import AIRequest, AIResponse, AIService
 
 
+class _StubService(AIService):
+    """Complete AIService whose answers are fixed at construction."""
+
+    def __init__(
+        self,
+        content: str = "test content",
+        available: bool = True,
+        valid_config: bool = True,
+    ):
+        self.content = content
+        self.available = available
+        self.valid_config = valid_config
+
+    def generate(self, request: AIRequest) -> AIResponse:
+        return AIResponse(content=self.content, model=request.model)
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def validate_config(self) -> bool:
+        return self.valid_config
+
+
+# Read-only instances: tests below only inspect attributes, never mutate.
+
+
+@pytest.fixture(scope="module")
+def full_ai_request():
+    """AIRequest with every tuning parameter set explicitly."""
+    return AIRequest(
+        prompt="Generate a presentation",
+        model="gpt-4",
+        max_tokens=2048,
+        temperature=0.8,
+    )
+
+
+@pytest.fixture(scope="module")
+def default_ai_request():
+    """AIRequest relying on default parameters."""
+    return AIRequest(prompt="Test prompt", model="gpt-4")
+
+
+@pytest.fixture(scope="module")
+def instructed_ai_request():
+    """AIRequest carrying system instructions."""
+    return AIRequest(
+        prompt="Test",
+        model="gpt-4",
+        system_instructions="You are a LaTeX expert",
+    )
+
+
+@pytest.fixture(scope="module")
+def full_ai_response():
+    """AIResponse with token usage and finish reason."""
+    return AIResponse(
+        content="\\documentclass{beamer}",
+        model="gpt-4",
+        tokens_used=1500,
+        finish_reason="stop",
+    )
+
+
+@pytest.fixture(scope="module")
+def default_ai_response():
+    """AIResponse relying on default values."""
+    return AIResponse(content="Test content", model="gpt-4")
+
+
+@pytest.fixture(scope="module")
+def metadata_ai_response():
+    """AIResponse carrying provider metadata."""
+    return AIResponse(
+        content="Test",
+        model="gpt-4",
+        metadata={"provider": "openai", "version": "v1"},
+    )
+
+
 class TestAIRequest:
     """Tests for AIRequest data contract."""
 
-    def test_valid_ai_request(self):
+    def test_valid_ai_request(self, full_ai_request):
         """Test creating a valid AI request."""
-        request = AIRequest(
-            prompt="Generate a presentation",
-            model="gpt-4",
-            max_tokens=2048,
-            temperature=0.8,
-        )
+        request = full_ai_request
         assert request.prompt == "Generate a presentation"
         assert request.model == "gpt-4"
         assert request.max_tokens == 2048
         assert request.temperature == 0.8
 
-    def test_default_values(self):
+    def test_default_values(self, default_ai_request):
         """Test default request parameters."""
-        request = AIRequest(
-            prompt="Test prompt",
-            model="gpt-4",
-        )
+        request = default_ai_request
         assert request.max_tokens == 4096
         assert request.temperature == 0.7
         assert request.system_instructions is None
 
-    def test_empty_prompt_raises_error(self):
-        """Test that empty prompt raises ValueError."""
-        with pytest.raises(ValueError, match="prompt must not be empty"):
-            AIRequest(prompt="", model="gpt-4")
-
-    def test_invalid_max_tokens_raises_error(self):
-        """Test that invalid max_tokens raises ValueError."""
-        with pytest.raises(ValueError, match="max_tokens must be > 0"):
-            AIRequest(
-                prompt="Test",
-                model="gpt-4",
-                max_tokens=0,
-            )
-
-        with pytest.raises(ValueError, match="max_tokens must be > 0"):
-            AIRequest(
-                prompt="Test",
-                model="gpt-4",
-                max_tokens=-100,
-            )
-
-    def test_excessive_max_tokens_raises_error(self):
-        """Test that max_tokens > 128000 raises ValueError."""
-        with pytest.raises(ValueError, match="max_tokens must be <= 128000"):
-            AIRequest(
-                prompt="Test",
-                model="gpt-4",
-                max_tokens=200000,
-            )
-
-    def test_invalid_temperature_raises_error(self):
-        """Test that invalid temperature raises ValueError."""
-        with pytest.raises(ValueError, match="temperature must be in range"):
-            AIRequest(
-                prompt="Test",
-                model="gpt-4",
-                temperature=-0.1,
-            )
-
-        with pytest.raises(ValueError, match="temperature must be in range"):
-            AIRequest(
-                prompt="Test",
-                model="gpt-4",
-                temperature=2.5,
-            )
-
-    def test_with_system_instructions(self):
+    @pytest.mark.parametrize(
+        "overrides, match",
+        [
+            ({"prompt": ""}, "prompt must not be empty"),
+            ({"max_tokens": 0}, "max_tokens must be > 0"),
+            ({"max_tokens": -100}, "max_tokens must be > 0"),
+            ({"max_tokens": 200000}, "max_tokens must be <= 128000"),
+            ({"temperature": -0.1}, "temperature must be in range"),
+            ({"temperature": 2.5}, "temperature must be in range"),
+        ],
+        ids=[
+            "empty_prompt",
+            "zero_max_tokens",
+            "negative_max_tokens",
+            "excessive_max_tokens",
+            "temperature_below_range",
+            "temperature_above_range",
+        ],
+    )
+    def test_invalid_request_raises_error(self, overrides, match):
+        """Test that out-of-range request parameters raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            AIRequest(**{"prompt": "Test", "model": "gpt-4", **overrides})
+
+    def test_with_system_instructions(self, instructed_ai_request):
         """Test request with system instructions."""
-        request = AIRequest(
-            prompt="Test",
-            model="gpt-4",
-            system_instructions="You are a LaTeX expert",
-        )
-        assert request.system_instructions == "You are a LaTeX expert"
+        assert instructed_ai_request.system_instructions == "You are a LaTeX expert"
 
 
 class TestAIResponse:
     """Tests for AIResponse data contract."""
 
-    def test_valid_ai_response(self):
+    def test_valid_ai_response(self, full_ai_response):
         """Test creating a valid AI response."""
-        response = AIResponse(
-            content="\\documentclass{beamer}",
-            model="gpt-4",
-            tokens_used=1500,
-            finish_reason="stop",
-        )
+        response = full_ai_response
         assert response.content == "\\documentclass{beamer}"
         assert response.model == "gpt-4"
         assert response.tokens_used == 1500
         assert response.finish_reason == "stop"
 
-    def test_default_values(self):
+    def test_default_values(self, default_ai_response):
         """Test default response values."""
-        response = AIResponse(
-            content="Test content",
-            model="gpt-4",
-        )
+        response = default_ai_response
         assert response.tokens_used is None
         assert response.finish_reason is None
         assert response.metadata == {}
@@ -119,13 +156,9 @@ class TestAIResponse:
         with pytest.raises(ValueError, match="content must not be empty"):
             AIResponse(content="", model="gpt-4")
 
-    def test_with_metadata(self):
+    def test_with_metadata(self, metadata_ai_response):
         """Test response with metadata."""
-        response = AIResponse(
-            content="Test",
-            model="gpt-4",
-            metadata={"provider": "openai", "version": "v1"},
-        )
+        response = metadata_ai_response
         assert response.metadata["provider"] == "openai"
         assert response.metadata["version"] == "v1"
 
@@ -138,60 +171,24 @@ class TestAIServiceInterface:
         with pytest.raises(TypeError):
             AIService()
 
-    def test_concrete_implementation_requires_all_methods(self):
+    @pytest.mark.parametrize(
+        "missing", ["generate", "is_available", "validate_config"]
+    )
+    def test_concrete_implementation_requires_all_methods(self, missing):
         """Test that concrete implementations must implement all abstract methods."""
-
-        # Missing generate method
-        class IncompleteService1(AIService):
-            def is_available(self) -> bool:
-                return True
-
-            def validate_config(self) -> bool:
-                return True
-
-        with pytest.raises(TypeError):
-            IncompleteService1()
-
-        # Missing is_available method
-        class IncompleteService2(AIService):
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(content="test", model="test")
-
-            def validate_config(self) -> bool:
-                return True
-
-        with pytest.raises(TypeError):
-            IncompleteService2()
-
-        # Missing validate_config method
-        class IncompleteService3(AIService):
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(content="test", model="test")
-
-            def is_available(self) -> bool:
-                return True
+        methods = {
+            name: getattr(_StubService, name)
+            for name in ("generate", "is_available", "validate_config")
+            if name != missing
+        }
+        incomplete_service = type(f"Missing_{missing}", (AIService,), methods)
 
         with pytest.raises(TypeError):
-            IncompleteService3()
+            incomplete_service()
 
     def test_complete_implementation_can_be_instantiated(self):
         """Test that complete implementations can be instantiated."""
-
-        class CompleteService(AIService):
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(
-                    content="\\documentclass{beamer}",
-                    model=request.model,
-                    tokens_used=100,
-                )
-
-            def is_available(self) -> bool:
-                return True
-
-            def validate_config(self) -> bool:
-                return True
-
-        service = CompleteService()
+        service = _StubService(content="\\documentclass{beamer}")
         assert isinstance(service, AIService)
 
         # Test that methods work
@@ -208,18 +205,7 @@ class TestAIServiceContract:
 
     def test_generate_returns_ai_response(self):
         """Test that generate returns AIResponse."""
-
-        class TestService(AIService):
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(content="test content", model=request.model)
-
-            def is_available(self) -> bool:
-                return True
-
-            def validate_config(self) -> bool:
-                return True
-
-        service = TestService()
+        service = _StubService()
         request = AIRequest(prompt="Test", model="test-model")
         response = service.generate(request)
 
@@ -229,44 +215,16 @@ class TestAIServiceContract:
 
     def test_is_available_returns_bool(self):
         """Test that is_available returns boolean."""
-
-        class TestService(AIService):
-            def __init__(self, available: bool):
-                self.available = available
-
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(content="test", model="test")
-
-            def is_available(self) -> bool:
-                return self.available
-
-            def validate_config(self) -> bool:
-                return True
-
-        available_service = TestService(available=True)
+        available_service = _StubService(available=True)
         assert available_service.is_available() is True
 
-        unavailable_service = TestService(available=False)
+        unavailable_service = _StubService(available=False)
         assert unavailable_service.is_available() is False
 
     def test_validate_config_returns_bool(self):
         """Test that validate_config returns boolean."""
-
-        class TestService(AIService):
-            def __init__(self, valid_config: bool):
-                self.valid_config = valid_config
-
-            def generate(self, request: AIRequest) -> AIResponse:
-                return AIResponse(content="test", model="test")
-
-            def is_available(self) -> bool:
-                return True
-
-            def validate_config(self) -> bool:
-                return self.valid_config
-
-        valid_service = TestService(valid_config=True)
+        valid_service = _StubService(valid_config=True)
         assert valid_service.validate_config() is True
 
-        invalid_service = TestService(valid_config=False)
+        invalid_service = _StubService(valid_config=False)
         assert invalid_service.validate_config() is False
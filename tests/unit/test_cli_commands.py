@@ -0,0 +1,59 @@
+"""Unit tests for CLI command helpers that do not need an AI service."""
+
+import subprocess
+
+import pytest
+
+from paperdeck.cli.commands import compile_latex
+
+
+@pytest.fixture
+def fake_pdflatex(monkeypatch):
+    """Replace subprocess.run with a pdflatex stand-in.
+
+    Each call writes the job's .pdf and an .aux file whose contents come
+    from ``aux_outputs`` in order; the list of argv lists is returned.
+    """
+    calls = []
+    aux_outputs = []
+
+    def _run(args, **kwargs):
+        calls.append(args)
+        output_dir, tex_path = args[-2], args[-1]
+        stem = tex_path.rsplit("/", 1)[-1].removesuffix(".tex")
+        with open(f"{output_dir}/{stem}.aux", "w") as f:
+            f.write(aux_outputs[len(calls) - 1])
+        with open(f"{output_dir}/{stem}.pdf", "wb") as f:
+            f.write(b"%PDF-1.5")
+        return subprocess.CompletedProcess(args, 0, "", "")
+
+    monkeypatch.setattr("paperdeck.cli.commands.subprocess.run", _run)
+    return calls, aux_outputs
+
+
+class TestCompileLatex:
+    """Tests for the pdflatex pass logic."""
+
+    def test_fresh_compile_runs_second_pass(self, tmp_path, fake_pdflatex):
+        """Test that a new .aux file triggers the reference pass."""
+        calls, aux_outputs = fake_pdflatex
+        aux_outputs.extend(["\\relax\n", "\\relax\n"])
+        tex_path = tmp_path / "deck.tex"
+        tex_path.write_text("\\documentclass{beamer}")
+
+        pdf_path = compile_latex(tex_path, tmp_path)
+
+        assert pdf_path == tmp_path / "deck.pdf"
+        assert len(calls) == 2
+
+    def test_recompile_with_unchanged_aux_runs_once(self, tmp_path, fake_pdflatex):
+        """Test that a pass leaving the aux files untouched is not repeated."""
+        calls, aux_outputs = fake_pdflatex
+        aux_outputs.append("\\relax\n")
+        (tmp_path / "deck.aux").write_text("\\relax\n")
+        tex_path = tmp_path / "deck.tex"
+        tex_path.write_text("\\documentclass{beamer}")
+
+        compile_latex(tex_path, tmp_path)
+
+        assert len(calls) == 1
@@ -11,6 +11,30 @@ from paperdeck.core.config import (
 from paperdeck.core.models import ElementType
 
 
+@pytest.fixture(scope="module")
+def prompt_lib(tmp_path_factory):
+    """An existing, empty prompt library directory shared by the module."""
+    return tmp_path_factory.mktemp("prompts")
+
+
+@pytest.fixture(scope="module")
+def default_extraction_config():
+    """Default ExtractionConfiguration; tests must not mutate it."""
+    return ExtractionConfiguration()
+
+
+@pytest.fixture(scope="module")
+def ollama_ai_config():
+    """Ollama AIServiceConfiguration; a local provider needs no API key."""
+    return AIServiceConfiguration(default_provider="ollama")
+
+
+@pytest.fixture(scope="module")
+def default_app_config():
+    """Default AppConfiguration; tests must not mutate it."""
+    return AppConfiguration()
+
+
 class TestExtractionConfiguration:
     """Tests for ExtractionConfiguration model."""
 
@@ -25,39 +49,37 @@ class TestExtractionConfiguration:
         assert len(config.element_types) == 2
         assert config.boundary_padding == 10
 
-    def test_default_values(self):
+    def test_default_values(self, default_extraction_config):
         """Test default configuration values."""
-        config = ExtractionConfiguration()
+        config = default_extraction_config
         assert config.confidence_threshold == 0.75
         assert len(config.element_types) == 3  # All types by default
         assert config.boundary_padding == 5
         assert config.overwrite_existing is False
 
-    def test_invalid_confidence_threshold(self):
-        """Test that invalid confidence threshold raises ValueError."""
-        with pytest.raises(ValueError, match="confidence_threshold must be in range"):
-            ExtractionConfiguration(confidence_threshold=1.5)
-
-        with pytest.raises(ValueError, match="confidence_threshold must be in range"):
-            ExtractionConfiguration(confidence_threshold=-0.1)
-
-    def test_empty_element_types(self):
-        """Test that empty element types raises ValueError."""
-        with pytest.raises(ValueError, match="element_types must not be empty"):
-            ExtractionConfiguration(element_types=[])
-
-    def test_invalid_boundary_padding(self):
-        """Test that negative boundary padding raises ValueError."""
-        with pytest.raises(ValueError, match="boundary_padding must be >= 0"):
-            ExtractionConfiguration(boundary_padding=-5)
-
-    def test_invalid_max_pages(self):
-        """Test that invalid max_pages raises ValueError."""
-        with pytest.raises(ValueError, match="max_pages must be > 0"):
-            ExtractionConfiguration(max_pages=0)
-
-        with pytest.raises(ValueError, match="max_pages must be > 0"):
-            ExtractionConfiguration(max_pages=-5)
+    @pytest.mark.parametrize(
+        "kwargs, pattern",
+        [
+            ({"confidence_threshold": 1.5}, "confidence_threshold must be in range"),
+            ({"confidence_threshold": -0.1}, "confidence_threshold must be in range"),
+            ({"element_types": []}, "element_types must not be empty"),
+            ({"boundary_padding": -5}, "boundary_padding must be >= 0"),
+            ({"max_pages": 0}, "max_pages must be > 0"),
+            ({"max_pages": -5}, "max_pages must be > 0"),
+        ],
+        ids=[
+            "confidence_above_range",
+            "confidence_below_range",
+            "empty_element_types",
+            "negative_boundary_padding",
+            "zero_max_pages",
+            "negative_max_pages",
+        ],
+    )
+    def test_invalid_values_raise_error(self, kwargs, pattern):
+        """Test that out-of-range configuration values raise ValueError."""
+        with pytest.raises(ValueError, match=pattern):
+            ExtractionConfiguration(**kwargs)
 
     def test_string_output_directory_converted_to_path(self):
         """Test that string output_directory is converted to Path."""
@@ -82,11 +104,9 @@ class TestAIServiceConfiguration:
         assert config.max_retries == 5
         assert config.timeout_seconds == 120
 
-    def test_default_values(self):
+    def test_default_values(self, ollama_ai_config):
         """Test default configuration values."""
-        config = AIServiceConfiguration(
-            default_provider="ollama"  # Local provider doesn't need API key
-        )
+        config = ollama_ai_config
         assert config.default_provider == "ollama"
         assert config.ollama_base_url == "http://localhost:11434"
         assert config.lmstudio_base_url == "http://localhost:1234"
@@ -112,10 +132,9 @@ class TestAIServiceConfiguration:
                 anthropic_api_key=None,
             )
 
-    def test_local_provider_no_api_key_required(self):
+    def test_local_provider_no_api_key_required(self, ollama_ai_config):
         """Test that local providers don't require API keys."""
-        config1 = AIServiceConfiguration(default_provider="ollama")
-        assert config1.default_provider == "ollama"
+        assert ollama_ai_config.default_provider == "ollama"
 
         config2 = AIServiceConfiguration(default_provider="lmstudio")
         assert config2.default_provider == "lmstudio"
@@ -140,11 +159,8 @@ class TestAIServiceConfiguration:
 class TestAppConfiguration:
     """Tests for AppConfiguration model."""
 
-    def test_valid_app_config(self, tmp_path):
+    def test_valid_app_config(self, prompt_lib):
         """Test creating a valid application configuration."""
-        prompt_lib = tmp_path / "prompts"
-        prompt_lib.mkdir()
-
         config = AppConfiguration(
             prompt_library_path=prompt_lib,
             default_prompt="technical",
@@ -156,31 +172,32 @@ class TestAppConfiguration:
         assert config.default_theme == "Berkeley"
         assert config.log_level == "DEBUG"
 
-    def test_default_values(self):
+    def test_default_values(self, default_app_config):
         """Test default configuration values."""
-        config = AppConfiguration()
+        config = default_app_config
         assert config.default_prompt == "default"
         assert config.default_theme == "Madrid"
         assert config.log_level == "INFO"
 
-    def test_string_paths_converted(self, tmp_path):
+    def test_string_paths_converted(self, prompt_lib):
         """Test that string paths are converted to Path objects."""
-        prompt_lib = tmp_path / "prompts"
-        prompt_lib.mkdir()
-
         config = AppConfiguration(
             prompt_library_path=str(prompt_lib),
-            output_directory=str(tmp_path / "output"),
+            output_directory=str(prompt_lib.parent / "output"),
         )
         assert isinstance(config.prompt_library_path, Path)
         assert isinstance(config.output_directory, Path)
 
-    def test_user_path_expansion(self):
+    def test_user_path_expansion(self, monkeypatch):
         """Test that user paths (~) are expanded."""
+        # With HOME set, expanduser never falls back to the passwd database
+        monkeypatch.setenv("HOME", "/fake/home")
+
         config = AppConfiguration(
             prompt_library_path=Path("~/.paperdeck/prompts")
         )
         assert "~" not in str(config.prompt_library_path)
+        assert config.prompt_library_path == Path("/fake/home/.paperdeck/prompts")
 
     def test_invalid_log_level(self):
         """Test that invalid log level raises ValueError."""
@@ -212,10 +229,8 @@ class TestAppConfiguration:
         assert len(errors) > 0
         assert any("not a directory" in err for err in errors)
 
-    def test_validate_passes_with_valid_config(self, tmp_path):
+    def test_validate_passes_with_valid_config(self, prompt_lib, tmp_path):
         """Test validation passes with valid configuration."""
-        prompt_lib = tmp_path / "prompts"
-        prompt_lib.mkdir()
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
@@ -234,8 +249,7 @@ class TestAppConfiguration:
         config = AppConfiguration.load_from_file(Path("test.yaml"))
         assert isinstance(config, AppConfiguration)
 
-    def test_save_to_file_placeholder(self, tmp_path):
+    def test_save_to_file_placeholder(self, default_app_config, tmp_path):
         """Test save_to_file doesn't raise errors (placeholder)."""
-        config = AppConfiguration()
-        config.save_to_file(tmp_path / "config.yaml")
+        default_app_config.save_to_file(tmp_path / "config.yaml")
         # Should not raise any errors
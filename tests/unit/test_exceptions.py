@@ -25,62 +25,36 @@ class TestExceptionHierarchy:
         assert isinstance(error, Exception)
         assert str(error) == "Base error"
 
-    def test_configuration_error_inherits_from_base(self):
-        """Test that ConfigurationError inherits from PaperDeckError."""
-        error = ConfigurationError("Config error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_validation_error_inherits_from_base(self):
-        """Test that ValidationError inherits from PaperDeckError."""
-        error = ValidationError("Validation error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_extraction_error_inherits_from_base(self):
-        """Test that ExtractionError inherits from PaperDeckError."""
-        error = ExtractionError("Extraction error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_ai_service_error_inherits_from_base(self):
-        """Test that AIServiceError inherits from PaperDeckError."""
-        error = AIServiceError("AI service error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_service_unavailable_error_inherits_from_ai_service(self):
-        """Test that ServiceUnavailableError inherits from AIServiceError."""
-        error = ServiceUnavailableError("Service unavailable")
-        assert isinstance(error, AIServiceError)
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_rate_limit_exceeded_error_inherits_from_ai_service(self):
-        """Test that RateLimitExceededError inherits from AIServiceError."""
-        error = RateLimitExceededError("Rate limit exceeded")
-        assert isinstance(error, AIServiceError)
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_prompt_error_inherits_from_base(self):
-        """Test that PromptError inherits from PaperDeckError."""
-        error = PromptError("Prompt error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_generation_error_inherits_from_base(self):
-        """Test that GenerationError inherits from PaperDeckError."""
-        error = GenerationError("Generation error")
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
-
-    def test_compilation_error_inherits_from_generation(self):
-        """Test that CompilationError inherits from GenerationError."""
-        error = CompilationError("Compilation error")
-        assert isinstance(error, GenerationError)
-        assert isinstance(error, PaperDeckError)
-        assert isinstance(error, Exception)
+    @pytest.mark.parametrize(
+        "exc_cls, parents",
+        [
+            (ConfigurationError, (PaperDeckError,)),
+            (ValidationError, (PaperDeckError,)),
+            (ExtractionError, (PaperDeckError,)),
+            (AIServiceError, (PaperDeckError,)),
+            (ServiceUnavailableError, (AIServiceError, PaperDeckError)),
+            (RateLimitExceededError, (AIServiceError, PaperDeckError)),
+            (PromptError, (PaperDeckError,)),
+            (GenerationError, (PaperDeckError,)),
+            (CompilationError, (GenerationError, PaperDeckError)),
+        ],
+        ids=[
+            "ConfigurationError",
+            "ValidationError",
+            "ExtractionError",
+            "AIServiceError",
+            "ServiceUnavailableError",
+            "RateLimitExceededError",
+            "PromptError",
+            "GenerationError",
+            "CompilationError",
+        ],
+    )
+    def test_error_inherits_from_parents(self, exc_cls, parents):
+        """Test that each custom exception inherits from its expected parents."""
+        error = exc_cls("error")
+        for parent in parents:
+            assert isinstance(error, parent)
 
 
 class TestExceptionUsage:
@@ -143,47 +117,28 @@ class TestExceptionUsage:
 class TestExceptionRaising:
     """Tests for raising exceptions in different scenarios."""
 
-    def test_raise_configuration_error(self):
-        """Test raising ConfigurationError."""
-
-        def bad_config():
-            raise ConfigurationError("Missing API key")
-
-        with pytest.raises(ConfigurationError, match="Missing API key"):
-            bad_config()
-
-    def test_raise_extraction_error(self):
-        """Test raising ExtractionError."""
-
-        def failed_extraction():
-            raise ExtractionError("Failed to extract figures")
-
-        with pytest.raises(ExtractionError, match="Failed to extract"):
-            failed_extraction()
-
-    def test_raise_service_unavailable(self):
-        """Test raising ServiceUnavailableError."""
-
-        def service_down():
-            raise ServiceUnavailableError("OpenAI service is down")
-
-        with pytest.raises(ServiceUnavailableError, match="service is down"):
-            service_down()
-
-    def test_raise_rate_limit_exceeded(self):
-        """Test raising RateLimitExceededError."""
-
-        def rate_limited():
-            raise RateLimitExceededError("Rate limit: 20 requests/minute")
-
-        with pytest.raises(RateLimitExceededError, match="Rate limit"):
-            rate_limited()
-
-    def test_raise_compilation_error(self):
-        """Test raising CompilationError."""
-
-        def latex_compile_failed():
-            raise CompilationError("pdflatex failed with exit code 1")
-
-        with pytest.raises(CompilationError, match="pdflatex failed"):
-            latex_compile_failed()
+    @pytest.mark.parametrize(
+        "exc_cls, message, pattern",
+        [
+            (ConfigurationError, "Missing API key", "Missing API key"),
+            (ExtractionError, "Failed to extract figures", "Failed to extract"),
+            (ServiceUnavailableError, "OpenAI service is down", "service is down"),
+            (RateLimitExceededError, "Rate limit: 20 requests/minute", "Rate limit"),
+            (CompilationError, "pdflatex failed with exit code 1", "pdflatex failed"),
+        ],
+        ids=[
+            "ConfigurationError",
+            "ExtractionError",
+            "ServiceUnavailableError",
+            "RateLimitExceededError",
+            "CompilationError",
+        ],
+    )
+    def test_raise_error(self, exc_cls, message, pattern):
+        """Test raising each exception preserves a matchable message."""
+
+        def failing_operation():
+            raise exc_cls(message)
+
+        with pytest.raises(exc_cls, match=pattern):
+            failing_operation()
@@ -89,6 +89,16 @@ class TestPaperExtractor:
         with pytest.raises((FileNotFoundError, ValueError)):
             extractor.extract(Path("/nonexistent/paper.pdf"))
 
+    def test_extractor_rejects_directory(self, tmp_path):
+        """Test that extractor raises ValueError for a directory named like a PDF."""
+        from paperdeck.extraction.extractor import PaperExtractor
+
+        paper_dir = tmp_path / "folder.pdf"
+        paper_dir.mkdir()
+
+        with pytest.raises(ValueError, match="not a file"):
+            PaperExtractor().extract(paper_dir)
+
     def test_extractor_extracts_all_types_by_default(self, tmp_path):
         """Test that extractor extracts all element types by default."""
         from paperdeck.extraction.extractor import PaperExtractor
@@ -127,6 +137,15 @@ class TestPDFProcessor:
         result = validate_pdf(txt_file)
         assert result is False
 
+    def test_pdf_validation_rejects_missing_and_directory(self, tmp_path):
+        """Test that PDF validation rejects paths that are not regular files."""
+        from paperdeck.extraction.pdf_processor import validate_pdf
+
+        (tmp_path / "folder.pdf").mkdir()
+
+        assert validate_pdf(tmp_path / "folder.pdf") is False
+        assert validate_pdf(tmp_path / "missing.pdf") is False
+
     def test_pdf_validation_detects_encryption(self, tmp_path):
         """Test that PDF validation detects encrypted PDFs."""
         from paperdeck.extraction.pdf_processor import is_encrypted
@@ -140,6 +159,40 @@ class TestPDFProcessor:
         # Accept either True (if detected) or False (mock doesn't have real encryption)
         assert isinstance(result, bool)
 
+    def test_is_encrypted_scans_trailer_of_large_file(self, tmp_path):
+        """Test that /Encrypt in the trailer is found past the header window."""
+        from paperdeck.extraction.pdf_processor import is_encrypted
+
+        pdf_file = tmp_path / "encrypted.pdf"
+        pdf_file.write_bytes(
+            b"%PDF-1.4\n" + b"0" * 100_000 + b"\ntrailer\n<< /Encrypt 5 0 R >>\n%%EOF"
+        )
+
+        assert is_encrypted(pdf_file) is True
+
+    def test_is_encrypted_finds_marker_across_head_window(self, tmp_path):
+        """Test that /Encrypt straddling the end of the 1 KB head read is found."""
+        from paperdeck.extraction.pdf_processor import is_encrypted
+
+        pdf_file = tmp_path / "encrypted.pdf"
+        prefix = b"%PDF-1.4\n".ljust(1020, b"0")
+        pdf_file.write_bytes(prefix + b"/Encrypt 5 0 R\n" + b"0" * 1000)
+
+        assert is_encrypted(pdf_file) is True
+
+    def test_get_page_count_reads_real_pdf(self, tmp_path):
+        """Test that get_page_count counts the pages of a generated PDF."""
+        fitz = pytest.importorskip("fitz")
+        from paperdeck.extraction.pdf_processor import get_page_count
+
+        pdf_file = tmp_path / "three_pages.pdf"
+        with fitz.open() as doc:
+            for _ in range(3):
+                doc.new_page()
+            doc.save(pdf_file)
+
+        assert get_page_count(pdf_file) == 3
+
     def test_get_page_count_returns_integer(self, tmp_path):
         """Test that get_page_count returns page count."""
         from paperdeck.extraction.pdf_processor import get_page_count
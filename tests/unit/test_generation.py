@@ -4,7 +4,6 @@ These tests verify LaTeX code generation, escaping, and slide organization.
 Tests should FAIL until implementations are complete (TDD).
 """
 
-import pytest
 from pathlib import Path
 
 from paperdeck.core.models import (
@@ -86,6 +85,16 @@ class TestLaTeXGenerator:
         assert r"\%" in escaped
         assert r"\$" in escaped
 
+    def test_escape_latex_handles_long_text_outside_the_cache(self):
+        """Test that long bodies escape the same as the short, memoized path."""
+        from paperdeck.generation.latex_generator import escape_latex
+
+        chunk = "R&D {50%} ~ x^2 \\ "
+        expected = escape_latex(chunk)
+
+        assert escape_latex(chunk * 50) == expected * 50
+        assert escape_latex(chunk) is escape_latex(chunk)
+
     def test_latex_generator_handles_figures(self, tmp_path):
         """Test that generator includes figures in LaTeX."""
         from paperdeck.generation.latex_generator import LaTeXGenerator
@@ -143,6 +152,87 @@ class TestLaTeXGenerator:
         # Verify escape_latex filter exists
         assert "escape_latex" in env.filters
 
+    def test_generators_share_env_per_template_dir(self, tmp_path):
+        """Test that generators share one environment per template directory."""
+        from paperdeck.generation.latex_generator import LaTeXGenerator
+
+        assert LaTeXGenerator().env is LaTeXGenerator().env
+        assert LaTeXGenerator(tmp_path).env is LaTeXGenerator(tmp_path).env
+        assert LaTeXGenerator(tmp_path).env is not LaTeXGenerator().env
+
+    def test_create_jinja_env_returns_fresh_environment(self):
+        """Test that the public factories never hand out the shared environment."""
+        from paperdeck.generation.latex_generator import (
+            LaTeXGenerator,
+            create_jinja_env,
+            get_jinja_env,
+        )
+
+        env = create_jinja_env()
+        env.filters["shout"] = str.upper
+
+        assert env is not create_jinja_env()
+        assert get_jinja_env() is not LaTeXGenerator().env
+        assert "shout" not in LaTeXGenerator().env.filters
+
+    def test_shared_env_picks_up_edited_templates(self, tmp_path):
+        """Test that a template edited on disk is reloaded by the shared env."""
+        import os
+
+        from paperdeck.generation.latex_generator import LaTeXGenerator
+
+        template_file = tmp_path / "note.tex.j2"
+        template_file.write_text("old")
+        env = LaTeXGenerator(tmp_path).env
+        assert env.get_template("note.tex.j2").render() == "old"
+
+        template_file.write_text("new")
+        mtime = template_file.stat().st_mtime
+        os.utime(template_file, (mtime + 10, mtime + 10))
+
+        assert env.get_template("note.tex.j2").render() == "new"
+
+    def test_write_from_template_matches_rendered_string(self, tmp_path):
+        """Test that streaming a template to disk writes the rendered document."""
+        from paperdeck.generation.latex_generator import LaTeXGenerator
+
+        pdf_file = tmp_path / "test.pdf"
+        pdf_file.write_text("dummy")
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "deck.tex.j2").write_text(
+            "\\title{\\VAR{title}}\n"
+            "\\BLOCK{for slide in slides}\n"
+            "\\begin{frame}{\\VAR{slide.title}}\\end{frame}\n"
+            "\\BLOCK{endfor}\n"
+        )
+
+        presentation = Presentation(
+            paper=Paper(file_path=pdf_file),
+            slides=[
+                Slide(
+                    title=f"Slide {i}",
+                    content_type=SlideContentType.TEXT,
+                    content="Content",
+                    sequence_number=i,
+                )
+                for i in range(3)
+            ],
+            theme="Madrid",
+            title="Streamed",
+            author="Author",
+        )
+        generator = LaTeXGenerator(template_dir=template_dir)
+
+        output_path = generator.write_from_template(
+            presentation, "deck.tex.j2", tmp_path / "deck.tex"
+        )
+
+        assert output_path.read_text(encoding="utf-8") == generator.generate_from_template(
+            presentation, "deck.tex.j2"
+        )
+        assert "\\begin{frame}{Slide 2}" in output_path.read_text(encoding="utf-8")
+
 
 class TestSlideOrganizer:
     """Tests for intelligent slide organization."""
@@ -1,7 +1,6 @@
 """Unit tests for core data models."""
 
 import pytest
-from pathlib import Path
 from uuid import uuid4
 
 from paperdeck.core.models import (
@@ -31,19 +30,20 @@ class TestBoundingBox:
         assert bbox.width == 100.0
         assert bbox.height == 150.0
 
-    def test_negative_coordinates_raise_error(self):
+    @pytest.mark.parametrize(
+        "x, y, width, height",
+        [
+            (-10.0, 20.0, 100.0, 150.0),
+            (10.0, -20.0, 100.0, 150.0),
+            (10.0, 20.0, -100.0, 150.0),
+            (10.0, 20.0, 100.0, -150.0),
+        ],
+        ids=["x", "y", "width", "height"],
+    )
+    def test_negative_coordinates_raise_error(self, x, y, width, height):
         """Test that negative coordinates raise ValueError."""
         with pytest.raises(ValueError, match="non-negative"):
-            BoundingBox(x=-10.0, y=20.0, width=100.0, height=150.0)
-
-        with pytest.raises(ValueError, match="non-negative"):
-            BoundingBox(x=10.0, y=-20.0, width=100.0, height=150.0)
-
-        with pytest.raises(ValueError, match="non-negative"):
-            BoundingBox(x=10.0, y=20.0, width=-100.0, height=150.0)
-
-        with pytest.raises(ValueError, match="non-negative"):
-            BoundingBox(x=10.0, y=20.0, width=100.0, height=-150.0)
+            BoundingBox(x=x, y=y, width=width, height=height)
 
 
 class TestPaperSection:
@@ -116,7 +116,8 @@ class TestExtractedElement:
         assert element.page_number == 1
         assert element.confidence_score == 0.95
 
-    def test_invalid_confidence_score_raises_error(self):
+    @pytest.mark.parametrize("confidence_score", [1.5, -0.1])
+    def test_invalid_confidence_score_raises_error(self, confidence_score):
         """Test that invalid confidence score raises ValueError."""
         bbox = BoundingBox(x=10.0, y=20.0, width=100.0, height=150.0)
 
@@ -126,17 +127,7 @@ class TestExtractedElement:
                 element_type=ElementType.FIGURE,
                 page_number=1,
                 bounding_box=bbox,
-                confidence_score=1.5,
-                sequence_number=1,
-            )
-
-        with pytest.raises(ValueError, match="confidence_score must be in range"):
-            ExtractedElement(
-                uuid=uuid4(),
-                element_type=ElementType.FIGURE,
-                page_number=1,
-                bounding_box=bbox,
-                confidence_score=-0.1,
+                confidence_score=confidence_score,
                 sequence_number=1,
             )
 
@@ -154,6 +145,38 @@ class TestExtractedElement:
                 sequence_number=1,
             )
 
+    @pytest.mark.parametrize(
+        "element_class, element_type",
+        [
+            (FigureElement, ElementType.FIGURE),
+            (TableElement, ElementType.TABLE),
+            (EquationElement, ElementType.EQUATION),
+        ],
+    )
+    def test_subclasses_use_slots_and_inherit_validation(self, element_class, element_type):
+        """Test that element subclasses carry no __dict__ and still validate."""
+        bbox = BoundingBox(x=10.0, y=20.0, width=100.0, height=150.0)
+        element = element_class(
+            uuid=uuid4(),
+            element_type=element_type,
+            page_number=1,
+            bounding_box=bbox,
+            confidence_score=0.95,
+            sequence_number=1,
+        )
+        assert not hasattr(element, "__dict__")
+        assert not hasattr(bbox, "__dict__")
+
+        with pytest.raises(ValueError, match="confidence_score"):
+            element_class(
+                uuid=uuid4(),
+                element_type=element_type,
+                page_number=1,
+                bounding_box=bbox,
+                confidence_score=1.5,
+                sequence_number=1,
+            )
+
 
 class TestFigureElement:
     """Tests for FigureElement model."""
@@ -220,36 +243,29 @@ class TestEquationElement:
 class TestPaper:
     """Tests for Paper model."""
 
-    def test_valid_paper(self, tmp_path):
+    def test_valid_paper(self, sample_pdf_path):
         """Test creating a valid paper."""
-        # Create a temporary PDF file
-        pdf_file = tmp_path / "test_paper.pdf"
-        pdf_file.write_text("dummy pdf content")
-
         paper = Paper(
-            file_path=pdf_file,
+            file_path=sample_pdf_path,
             title="Test Paper",
             authors=["Author 1", "Author 2"],
             abstract="This is a test paper.",
         )
-        assert paper.file_path == pdf_file
+        assert paper.file_path == sample_pdf_path
         assert paper.title == "Test Paper"
         assert len(paper.authors) == 2
 
-    def test_nonexistent_file_raises_error(self, tmp_path):
+    def test_nonexistent_file_raises_error(self, sample_pdf_path):
         """Test that nonexistent file raises FileNotFoundError."""
-        pdf_file = tmp_path / "nonexistent.pdf"
+        pdf_file = sample_pdf_path.with_name("nonexistent.pdf")
 
         with pytest.raises(FileNotFoundError, match="Paper file not found"):
             Paper(file_path=pdf_file)
 
-    def test_non_pdf_extension_raises_error(self, tmp_path):
+    def test_non_pdf_extension_raises_error(self, sample_txt_path):
         """Test that non-PDF extension raises ValueError."""
-        txt_file = tmp_path / "test.txt"
-        txt_file.write_text("not a pdf")
-
         with pytest.raises(ValueError, match="must have .pdf extension"):
-            Paper(file_path=txt_file)
+            Paper(file_path=sample_txt_path)
 
 
 class TestSlide:
@@ -308,22 +324,11 @@ class TestSlide:
 class TestPresentation:
     """Tests for Presentation model."""
 
-    def test_valid_presentation(self, tmp_path):
+    def test_valid_presentation(self, sample_paper, sample_slide):
         """Test creating a valid presentation."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-
-        paper = Paper(file_path=pdf_file)
-        slide = Slide(
-            title="Title",
-            content_type=SlideContentType.TEXT,
-            content="Content",
-            sequence_number=1,
-        )
-
         presentation = Presentation(
-            paper=paper,
-            slides=[slide],
+            paper=sample_paper,
+            slides=[sample_slide],
             theme="Madrid",
             title="Test Presentation",
             author="Test Author",
@@ -332,36 +337,22 @@ class TestPresentation:
         assert presentation.title == "Test Presentation"
         assert len(presentation.slides) == 1
 
-    def test_empty_slides_raises_error(self, tmp_path):
+    def test_empty_slides_raises_error(self, sample_paper):
         """Test that empty slides list raises ValueError."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-        paper = Paper(file_path=pdf_file)
-
         with pytest.raises(ValueError, match="must have at least one slide"):
             Presentation(
-                paper=paper,
+                paper=sample_paper,
                 slides=[],
                 theme="Madrid",
                 title="Test",
                 author="Author",
             )
 
-    def test_to_latex_generates_document(self, tmp_path):
+    def test_to_latex_generates_document(self, sample_paper, sample_slide):
         """Test that to_latex generates valid beamer document."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-        paper = Paper(file_path=pdf_file)
-        slide = Slide(
-            title="Title",
-            content_type=SlideContentType.TEXT,
-            content="Content",
-            sequence_number=1,
-        )
-
         presentation = Presentation(
-            paper=paper,
-            slides=[slide],
+            paper=sample_paper,
+            slides=[sample_slide],
             theme="Madrid",
             title="Test Presentation",
             author="Test Author",
@@ -374,11 +365,8 @@ class TestPresentation:
         assert "\\begin{document}" in latex
         assert "\\end{document}" in latex
 
-    def test_add_slide(self, tmp_path):
+    def test_add_slide(self, sample_paper):
         """Test adding slide to presentation."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-        paper = Paper(file_path=pdf_file)
         slide1 = Slide(
             title="Slide 1",
             content_type=SlideContentType.TEXT,
@@ -387,7 +375,7 @@ class TestPresentation:
         )
 
         presentation = Presentation(
-            paper=paper,
+            paper=sample_paper,
             slides=[slide1],
             theme="Madrid",
             title="Test",
@@ -405,12 +393,8 @@ class TestPresentation:
         assert len(presentation.slides) == 2
         assert presentation.slides[1].title == "Slide 2"
 
-    def test_reorder_slides(self, tmp_path):
+    def test_reorder_slides(self, sample_paper):
         """Test reordering slides in presentation."""
-        pdf_file = tmp_path / "test.pdf"
-        pdf_file.write_text("dummy")
-        paper = Paper(file_path=pdf_file)
-
         slides = [
             Slide(
                 title=f"Slide {i}",
@@ -422,7 +406,7 @@ class TestPresentation:
         ]
 
         presentation = Presentation(
-            paper=paper,
+            paper=sample_paper,
             slides=slides,
             theme="Madrid",
             title="Test",
@@ -435,3 +419,4 @@ class TestPresentation:
         assert presentation.slides[0].title == "Slide 2"
         assert presentation.slides[1].title == "Slide 0"
         assert presentation.slides[2].title == "Slide 1"
+        assert [slide.sequence_number for slide in presentation.slides] == [0, 1, 2]
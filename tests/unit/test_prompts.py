@@ -1,11 +1,44 @@
 """Unit tests for prompt management models."""
 
+import copy
+import dataclasses
+
 import pytest
 from pathlib import Path
 
 from paperdeck.prompts.manager import PromptLibrary, PromptTemplate
 
 
+@pytest.fixture(scope="module")
+def valid_template_proto():
+    """A minimal valid template, built once per module; copy it rather than using it."""
+    return PromptTemplate(
+        name="test",
+        description="Test",
+        content="Paper: {paper_content}",
+        style="technical",
+        detail_level="medium",
+    )
+
+
+@pytest.fixture
+def valid_template(valid_template_proto):
+    """A shallow copy of the prototype whose fields tests may reassign."""
+    return copy.copy(valid_template_proto)
+
+
+@pytest.fixture(scope="module")
+def library_dir(tmp_path_factory):
+    """An empty prompt library directory shared by the module; never written to."""
+    return tmp_path_factory.mktemp("prompts")
+
+
+@pytest.fixture
+def library(library_dir):
+    """A fresh PromptLibrary over the shared directory, with its own templates."""
+    return PromptLibrary(library_path=library_dir)
+
+
 class TestPromptTemplate:
     """Tests for PromptTemplate model."""
 
@@ -31,10 +64,7 @@ class TestPromptTemplate:
             style="technical",
             detail_level="medium",
         )
-        assert "paper_content" in template.placeholders
-        assert "authors" in template.placeholders
-        assert "title" in template.placeholders
-        assert len(template.placeholders) == 3
+        assert sorted(template.placeholders) == ["authors", "paper_content", "title"]
 
     def test_template_without_placeholders_is_valid(self):
         """Test that templates without placeholders are now valid."""
@@ -48,47 +78,40 @@ class TestPromptTemplate:
         assert template.name == "no_placeholders"
         assert len(template.placeholders) == 0
 
-    def test_unbalanced_braces_raise_error(self):
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "Paper: {paper_content with unclosed brace",
+            "Paper: }paper_content} extra closing",
+        ],
+        ids=["unclosed", "extra_closing"],
+    )
+    def test_unbalanced_braces_raise_error(self, content):
         """Test that unbalanced braces raise ValueError."""
         with pytest.raises(ValueError, match="balanced braces"):
             PromptTemplate(
                 name="invalid",
                 description="Invalid",
-                content="Paper: {paper_content with unclosed brace",
+                content=content,
                 style="technical",
                 detail_level="medium",
             )
 
-        with pytest.raises(ValueError, match="balanced braces"):
-            PromptTemplate(
-                name="invalid",
-                description="Invalid",
-                content="Paper: }paper_content} extra closing",
-                style="technical",
-                detail_level="medium",
-            )
-
-    def test_invalid_style_raises_error(self):
-        """Test that invalid style raises ValueError."""
-        with pytest.raises(ValueError, match="style must be in"):
-            PromptTemplate(
-                name="test",
-                description="Test",
-                content="Paper: {paper_content}",
-                style="invalid_style",
-                detail_level="medium",
-            )
-
-    def test_invalid_detail_level_raises_error(self):
-        """Test that invalid detail level raises ValueError."""
-        with pytest.raises(ValueError, match="detail_level must be in"):
-            PromptTemplate(
-                name="test",
-                description="Test",
-                content="Paper: {paper_content}",
-                style="technical",
-                detail_level="invalid",
-            )
+    @pytest.mark.parametrize(
+        "field_name, value, message",
+        [
+            ("name", "", "name must not be empty"),
+            ("style", "invalid_style", "style must be in"),
+            ("detail_level", "invalid", "detail_level must be in"),
+        ],
+        ids=["name", "style", "detail_level"],
+    )
+    def test_invalid_field_raises_error(
+        self, valid_template_proto, field_name, value, message
+    ):
+        """Test that invalid name, style or detail level raises ValueError."""
+        with pytest.raises(ValueError, match=message):
+            dataclasses.replace(valid_template_proto, **{field_name: value})
 
     def test_render_with_valid_context(self):
         """Test rendering template with valid context."""
@@ -118,29 +141,16 @@ class TestPromptTemplate:
         result = template.render()
         assert result == "Paper: {paper_content}, Title: {title}"
 
-    def test_validate_returns_true_for_valid_template(self):
+    def test_validate_returns_true_for_valid_template(self, valid_template):
         """Test that validate returns True for valid template."""
-        template = PromptTemplate(
-            name="test",
-            description="Test",
-            content="Paper: {paper_content}",
-            style="technical",
-            detail_level="medium",
-        )
+        template = valid_template
         is_valid, error = template.validate()
         assert is_valid is True
         assert error is None
 
-    def test_validate_detects_unbalanced_braces(self):
+    def test_validate_detects_unbalanced_braces(self, valid_template):
         """Test that validate detects unbalanced braces."""
-        # Create template with valid constructor, then break it
-        template = PromptTemplate(
-            name="test",
-            description="Test",
-            content="Paper: {paper_content}",
-            style="technical",
-            detail_level="medium",
-        )
+        template = valid_template
         # Manually break the content to test validation
         template.content = "Paper: {paper_content with unclosed"
 
@@ -148,15 +158,9 @@ class TestPromptTemplate:
         assert is_valid is False
         assert "Unbalanced braces" in error
 
-    def test_validate_allows_content_without_placeholders(self):
+    def test_validate_allows_content_without_placeholders(self, valid_template):
         """Test that validate allows content without placeholders."""
-        template = PromptTemplate(
-            name="test",
-            description="Test",
-            content="Paper: {paper_content}",
-            style="technical",
-            detail_level="medium",
-        )
+        template = valid_template
         # Remove placeholders - should still be valid
         template.content = "Paper: just some text with no placeholders"
 
@@ -164,15 +168,9 @@ class TestPromptTemplate:
         assert is_valid is True
         assert error is None
 
-    def test_validate_detects_excessive_length(self):
+    def test_validate_detects_excessive_length(self, valid_template):
         """Test that validate detects content over 10,000 characters."""
-        template = PromptTemplate(
-            name="test",
-            description="Test",
-            content="Paper: {paper_content}",
-            style="technical",
-            detail_level="medium",
-        )
+        template = valid_template
         # Make content too long
         template.content = "a" * 10001 + " {paper_content}"
 
@@ -184,15 +182,10 @@ class TestPromptTemplate:
 class TestPromptLibrary:
     """Tests for PromptLibrary model."""
 
-    def test_valid_prompt_library(self, tmp_path):
+    def test_valid_prompt_library(self, library, library_dir):
         """Test creating a valid prompt library."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-        (library_path / "_metadata.json").write_text("{}")
-
-        library = PromptLibrary(library_path=library_path)
-        assert library.library_path == library_path
-        assert library.metadata_file == library_path / "_metadata.json"
+        assert library.library_path == library_dir
+        assert library.metadata_file == library_dir / "_metadata.json"
 
     def test_nonexistent_library_path_raises_error(self):
         """Test that nonexistent path raises ValueError."""
@@ -202,18 +195,13 @@ class TestPromptLibrary:
     def test_non_directory_path_raises_error(self, tmp_path):
         """Test that non-directory path raises ValueError."""
         file_path = tmp_path / "not_a_directory"
-        file_path.write_text("content")
+        file_path.touch()
 
         with pytest.raises(ValueError, match="not a directory"):
             PromptLibrary(library_path=file_path)
 
-    def test_list_templates_returns_all(self, tmp_path):
+    def test_list_templates_returns_all(self, library):
         """Test that list_templates returns all loaded templates."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         # Add some templates
         template1 = PromptTemplate(
             name="template1",
@@ -234,17 +222,10 @@ class TestPromptLibrary:
         library.templates["template2"] = template2
 
         templates = library.list_templates()
-        assert len(templates) == 2
-        assert any(t.name == "template1" for t in templates)
-        assert any(t.name == "template2" for t in templates)
+        assert sorted(t.name for t in templates) == ["template1", "template2"]
 
-    def test_get_template_returns_existing(self, tmp_path):
+    def test_get_template_returns_existing(self, library):
         """Test that get_template returns existing template."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         template = PromptTemplate(
             name="test",
             description="Test",
@@ -258,42 +239,49 @@ class TestPromptLibrary:
         assert retrieved.name == "test"
         assert retrieved == template
 
-    def test_get_template_loads_from_file(self, tmp_path):
+    @pytest.mark.parametrize(
+        "name, body, metadata, expected_style",
+        [
+            ("fromfile", "Paper content: {paper_content}", None, "custom"),
+            ("plain", "Summarize the attached paper.", None, "custom"),
+            (
+                "described",
+                "Content: {paper_content}",
+                '{"described": {"style": "technical"}}',
+                "technical",
+            ),
+        ],
+        ids=["placeholder", "no_placeholders", "with_metadata"],
+    )
+    def test_get_template_loads_from_file(
+        self, tmp_path, name, body, metadata, expected_style
+    ):
         """Test that get_template loads from file if not in memory."""
         library_path = tmp_path / "prompts"
         library_path.mkdir()
-
-        # Create a template file
-        template_file = library_path / "fromfile.txt"
-        template_file.write_text("Paper content: {paper_content}")
+        (library_path / f"{name}.txt").write_text(body)
+        if metadata is not None:
+            (library_path / "_metadata.json").write_text(metadata)
 
         library = PromptLibrary(library_path=library_path)
 
         # Template not in memory yet
-        assert "fromfile" not in library.templates
+        assert name not in library.templates
 
         # Get template should load it
-        template = library.get_template("fromfile")
-        assert template.name == "fromfile"
-        assert "fromfile" in library.templates
+        template = library.get_template(name)
+        assert template.name == name
+        assert template.content == body
+        assert template.style == expected_style
+        assert name in library.templates
 
-    def test_get_template_raises_error_if_not_found(self, tmp_path):
+    def test_get_template_raises_error_if_not_found(self, library):
         """Test that get_template raises KeyError if template not found."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         with pytest.raises(KeyError, match="not found"):
             library.get_template("nonexistent")
 
-    def test_add_template_adds_to_library(self, tmp_path):
+    def test_add_template_adds_to_library(self, library):
         """Test that add_template adds template to library."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         template = PromptTemplate(
             name="new_template",
             description="New",
@@ -306,13 +294,8 @@ class TestPromptLibrary:
         assert "new_template" in library.templates
         assert library.templates["new_template"] == template
 
-    def test_add_template_raises_error_if_exists(self, tmp_path):
+    def test_add_template_raises_error_if_exists(self, library):
         """Test that add_template raises ValueError if template exists."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         template1 = PromptTemplate(
             name="duplicate",
             description="First",
@@ -335,13 +318,8 @@ class TestPromptLibrary:
         with pytest.raises(ValueError, match="already exists"):
             library.add_template(template2)
 
-    def test_remove_template_removes_from_library(self, tmp_path):
+    def test_remove_template_removes_from_library(self, library):
         """Test that remove_template removes user template."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         template = PromptTemplate(
             name="removable",
             description="Test",
@@ -357,13 +335,8 @@ class TestPromptLibrary:
         library.remove_template("removable")
         assert "removable" not in library.templates
 
-    def test_remove_template_raises_error_for_builtin(self, tmp_path):
+    def test_remove_template_raises_error_for_builtin(self, library):
         """Test that remove_template raises error for builtin templates."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         template = PromptTemplate(
             name="builtin",
             description="Builtin",
@@ -378,13 +351,8 @@ class TestPromptLibrary:
         with pytest.raises(ValueError, match="Cannot remove builtin"):
             library.remove_template("builtin")
 
-    def test_validate_all_returns_all_results(self, tmp_path):
+    def test_validate_all_returns_all_results(self, library):
         """Test that validate_all returns validation results for all templates."""
-        library_path = tmp_path / "prompts"
-        library_path.mkdir()
-
-        library = PromptLibrary(library_path=library_path)
-
         # Add valid template
         template1 = PromptTemplate(
             name="valid",